@@ -1,5 +1,3 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
-
 from agent.action.agentAction import AgentAction
 
 class AdoptAction(AgentAction):
@@ -9,17 +7,8 @@ class AdoptAction(AgentAction):
     a goal zone.
     """
 
+    __slots__ = ("roleName", "payload")
+
     def __init__(self, roleName: str) -> None:
         self.roleName = roleName
-    
-    def perform(self, agent: MapcAgent) -> str:
-        """
-        Sends the adopt action to the simulation server
-        and returns the result of it.
-        """
-
-        try:
-            agent.adopt(self.roleName)
-            return "success"
-        except MapcAgentActionError as e:
-            return e.args[0]
\ No newline at end of file
+        self.payload = ("adopt", [roleName])
\ No newline at end of file
@@ -1,18 +1,60 @@
-from abc import ABC, abstractclassmethod
+import asyncio
+import concurrent.futures
+
+from typing import Tuple
 from mapc2022 import Agent as MapcAgent
 
-class AgentAction(ABC):
+class AgentAction:
     """
     Abstraction for `Agent` actions sent to the simulation server.\n
     Wraps all the required parameters for the given action, so it can
-    be sent of its own.
+    be sent of its own.\n
+    It is a plain base class (not an `ABC`), so the `isinstance` checks
+    made on actions every step don't go through `ABCMeta`.
     """
 
-    @abstractclassmethod
-    def perform(self, _: MapcAgent) -> str:
+    __slots__ = ()
+
+    payload: Tuple[str, list]       # Action type and parameters in the form sent to the simulation server
+    failCode: str | None = None     # Set if the action is known to fail without sending it
+
+    def send(self, agent: MapcAgent) -> concurrent.futures.Future:
+        """
+        Sends the action to the simulation server without waiting
+        for the result of it.\n
+        If the action is known to fail then a skip is sent instead,
+        so the `Agent` still takes part in the step. In that case
+        `getResult` reports the fail code of the original action, while
+        the next dynamic percept reports the skip (last action "skip"
+        with "success"), so the two do not match for that step.
         """
-        Sends the the action to the simulation the server
-        and returns the result of it: succeeded or a fail code.
+
+        if self.failCode is not None:
+            return agent.send_action_nowait("skip", [])
+
+        return agent.send_action_nowait(*self.payload)
+
+    def getResult(self, future: concurrent.futures.Future) -> str | None:
         """
+        Waits for the sent action and returns the result
+        of it: succeeded or a fail code.
+        """
+
+        result = future.result()
+        return result if self.failCode is None else self.failCode
+
+    async def performAsync(self, agent: MapcAgent) -> str | None:
+        """
+        Sends the action to the simulation server without blocking
+        the event loop and returns the result of it, so the round trips
+        of multiple `Agents` can overlap. If the action was cancelled
+        (simulation ended) then the result is None.
+        """
+
+        future = self.send(agent)
+        await asyncio.wait([asyncio.wrap_future(future)])
 
-        pass
\ No newline at end of file
+        try:
+            return self.getResult(future)
+        except concurrent.futures.CancelledError:
+            return None
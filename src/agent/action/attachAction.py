@@ -1,4 +1,4 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
+import functools
 
 from data.coreData import Direction, MapValueEnum
 from agent.action.agentAction import AgentAction
@@ -9,9 +9,12 @@ class AttachAction(AgentAction):
     to the `Agent` to the given `Direction`.
     Only performable if the current `Agent` role can perform this action.\n
     Contains information about the attached entity, which can be used for tracking
-    the attached entities.
+    the attached entities.\n
+    The result does not contains information about the attached entity.
     """
 
+    __slots__ = ("direction", "entityType", "details", "payload")
+
     direction: Direction
     entityType: MapValueEnum
     details: str
@@ -20,16 +23,14 @@ class AttachAction(AgentAction):
         self.direction = direction
         self.entityType = entityType
         self.details = details
-    
-    def perform(self, agent: MapcAgent) -> str:
+        self.payload = ("attach", [str(direction)])
+
+    @staticmethod
+    @functools.lru_cache(maxsize = 4096)
+    def get(direction: Direction, entityType: MapValueEnum, details: str) -> 'AttachAction':
         """
-        Sends the attach action to the simulation server
-        and returns the result of it.
-        The result does not contains information about the attached entity.
+        Returns a shared `AttachAction` for the given parameters.
+        The returned action must not be modified.
         """
 
-        try:
-            agent.attach(str(self.direction))
-            return "success"
-        except MapcAgentActionError as e:
-            return e.args[0]
\ No newline at end of file
+        return AttachAction(direction, entityType, details)
\ No newline at end of file
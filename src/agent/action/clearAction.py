@@ -1,5 +1,3 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
-
 from data.coreData import Coordinate
 from agent.action.agentAction import AgentAction
 
@@ -11,19 +9,10 @@ class ClearAction(AgentAction):
     it can not damage it (its energy won't be decreased).
     """
 
+    __slots__ = ("relCoordinate", "payload")
+
     relCoordinate: Coordinate
 
     def __init__(self, relCoordinate: Coordinate) -> None:
         self.relCoordinate = relCoordinate
-    
-    def perform(self, agent: MapcAgent) -> str:
-        """
-        Sends the clear action to the simulation server
-        and returns the result of it.
-        """
-
-        try:
-            agent.clear((self.relCoordinate.x, self.relCoordinate.y))
-            return "success"
-        except MapcAgentActionError as e:
-            return e.args[0]
\ No newline at end of file
+        self.payload = ("clear", [relCoordinate.x, relCoordinate.y])
\ No newline at end of file
@@ -1,4 +1,4 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
+import functools
 
 from data.coreData import Direction
 from agent.action.agentAction import AgentAction
@@ -7,25 +7,29 @@ class MoveAction(AgentAction):
     """
     Moves the `Agent` to the given `Directions`. Note that
     not every of them will succeed.\n
+    If succeeded, all of the moves were completed,
+    if failed then none of them, partial means at least
+    one of them succeeded. The later can make the `Agents`
+    disorientated, since they don't know how much they moved.
     """
 
+    __slots__ = ("directions", "payload", "failCode")
+
     directions: list[Direction]
 
     def __init__(self, directions: list[Direction]) -> None:
         self.directions = directions
-    
-    def perform(self, agent: MapcAgent) -> str:
+        self.payload = ("move", [str(direction) for direction in directions])
+
+        # Moving without directions would be rejected by the simulation server
+        self.failCode = None if directions else "failed_parameter"
+
+    @staticmethod
+    @functools.lru_cache(maxsize = 256)
+    def get(*directions: Direction) -> 'MoveAction':
         """
-        Sends the move action to the simulation server
-        and returns the result of it.\n
-        If succeeded, all of the moves were completed,
-        if failed then none of them, partial means at least
-        one of them succeeded. The later can make the `Agents`
-        disorientated, since they don't know how much they moved.
+        Returns a shared `MoveAction` for the given `Directions`.
+        The returned action must not be modified.
         """
 
-        try:
-            agent.move([str(direction) for direction in self.directions])
-            return "success"
-        except MapcAgentActionError as e:
-            return e.args[0]
\ No newline at end of file
+        return MoveAction(list(directions))
\ No newline at end of file
@@ -1,5 +1,3 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
-
 from data.coreData import Direction
 from agent.action.agentAction import AgentAction
 
@@ -9,20 +7,11 @@ class RequestAction(AgentAction):
     to the `Agent` to the given `Direction`.
     Only performable if the current `Agent` role can perform this action.
     """
+
+    __slots__ = ("direction", "payload")
     
     direction: Direction
 
     def __init__(self, direction: Direction) -> None:
         self.direction = direction
-    
-    def perform(self, agent: MapcAgent) -> str:
-        """
-        Sends the request action to the simulation server
-        and returns the result of it.
-        """
-
-        try:
-            agent.request(str(self.direction))
-            return "success"
-        except MapcAgentActionError as e:
-            return e.args[0]
\ No newline at end of file
+        self.payload = ("request", [str(direction)])
\ No newline at end of file
@@ -1,4 +1,4 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
+import functools
 
 from data.coreData import RotateDirection
 from agent.action.agentAction import AgentAction
@@ -9,19 +9,19 @@ class RotateAction(AgentAction):
     to the given `Direction`.
     """
 
+    __slots__ = ("rotateDirection", "payload")
+
     rotateDirection: RotateDirection
 
     def __init__(self, rotateDirection: RotateDirection) -> None:
         self.rotateDirection = rotateDirection
+        self.payload = ("rotate", [str(rotateDirection)])
 
-    def perform(self, agent: MapcAgent) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize = None)
+    def get(rotateDirection: RotateDirection) -> 'RotateAction':
         """
-        Sends the rotate action to the simulation server
-        and returns the result of it.
+        Returns the shared `RotateAction` for the given `RotateDirection`.
         """
 
-        try:
-            agent.rotate(str(self.rotateDirection))
-            return "success"
-        except MapcAgentActionError as e:
-            return e.args[0]
\ No newline at end of file
+        return RotateAction(rotateDirection)
\ No newline at end of file
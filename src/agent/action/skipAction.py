@@ -1,4 +1,5 @@
-from mapc2022 import Agent as MapcAgent, AgentActionError as MapcAgentActionError
+import concurrent.futures
+import functools
 
 from agent.action.agentAction import AgentAction
 
@@ -7,13 +8,24 @@ class SkipAction(AgentAction):
     The `Agent` skips this step, it won't do anything.\n
     """
 
-    def perform(self, agent: MapcAgent) -> str:
+    __slots__ = ()
+
+    payload = ("skip", [])
+
+    @staticmethod
+    @functools.lru_cache(maxsize = None)
+    def get() -> 'SkipAction':
+        """
+        Returns the shared `SkipAction`, it has no parameters
+        so one instance is enough.
+        """
+
+        return SkipAction()
+
+    def getResult(self, future: concurrent.futures.Future) -> str:
         """
-        Returns the skip action, always succeeds.
+        Waits for the skip action, always succeeds.
         """
 
-        try:
-            agent.skip()
-        except MapcAgentActionError:
-            pass
+        future.result()
         return "success"
\ No newline at end of file
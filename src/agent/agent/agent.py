@@ -2,7 +2,7 @@ from typing import Type
 import mapc2022 as mapc2022
 
 from data.coreData import Coordinate, AgentActionEnum, AttachedEntity, MapcRole, MapValueEnum, AgentIntentionRole
-from data.map import MapUpdateData
+from data.map import MapUpdateData, DynamicMap
 from data.server import SimulationDataServer, MapServer
 from data.wrapper import DynamicPerceptWrapper
 from data.intention import Observation
@@ -19,6 +19,9 @@ class Agent:
     sends informations to the local servers.
     """
 
+    __slots__ = ("id", "mapServer", "simDataServer", "dynamicPerceptWrapper", "observation", "attachedEntities",
+        "mapcAgent", "mapcRole", "intentionHandler", "action", "bidCache", "bidAgentCoordinate")
+
     id: str
     mapServer: MapServer
     simDataServer: SimulationDataServer
@@ -29,6 +32,8 @@ class Agent:
     mapcRole: MapcRole | None
     intentionHandler: IntentionHandler
     action: AgentAction | None
+    bidCache: dict[tuple, Coordinate | None]                # Closest role zones and dispensers used for bidding in the current step
+    bidAgentCoordinate: Coordinate | None                   # Current Coordinate used for bidding in the current step
 
     def __init__(self, id : str, mapServer: MapServer, simDataServer: SimulationDataServer) -> None:
         self.id = id
@@ -44,6 +49,8 @@ class Agent:
         
         self.intentionHandler = IntentionHandler(self.id)
         self.action = None
+        self.bidCache = dict()
+        self.bidAgentCoordinate = None
     
     def connect(self, host: str, port: int, password: str) -> None:
         """
@@ -59,8 +66,12 @@ class Agent:
         Also sends basic information to the `SimulationDataServer`.
         """
 
-        self.dynamicPerceptWrapper = DynamicPerceptWrapper(self.mapcAgent.dynamic["percept"],
-                            self.simDataServer.staticPercept.roles, self.mapcAgent.dynamic["step"])
+        # Fetch the percept once, every access waits for the connection's event loop
+        dynamic = self.mapcAgent.dynamic
+        step = dynamic["step"]
+
+        self.dynamicPerceptWrapper = DynamicPerceptWrapper(dynamic["percept"],
+                            self.simDataServer.staticPercept.roles, step)
         self.mapcRole = self.simDataServer.staticPercept.roles[self.dynamicPerceptWrapper.role]
 
         updateData = MapUpdateData(
@@ -70,10 +81,10 @@ class Agent:
             self.dynamicPerceptWrapper.goalZones,
             self.dynamicPerceptWrapper.roleZones
         )
-        self.mapServer.registerNewMap(self.id, self.simDataServer.markerPurgeInterval, self.mapcAgent.dynamic["step"],
+        self.mapServer.registerNewMap(self.id, self.simDataServer.markerPurgeInterval, step,
             updateData)
         self.simDataServer.setAgentMaxEnegy(self.dynamicPerceptWrapper.energy)
-        self.simDataServer.setSimulationStep(self.mapcAgent.dynamic["step"])
+        self.simDataServer.setSimulationStep(step)
         self.simDataServer.updateTasks(self.dynamicPerceptWrapper.tasks)
         self.setObservation()
 
@@ -99,13 +110,14 @@ class Agent:
         self.intentionHandler.filterOptions()
 
     async def planNextAction(self) -> None:
-        self.setObservation()
+        # The Observation is up to date: it is rebuilt whenever its sources change
+        # (new dynamic percept, Coordinate shift or normalization)
 
         if not self.observation.agentData.deactivated:
             currentIntention = self.intentionHandler.getCurrentIntention()
             self.action = await currentIntention.planNextAction(self.observation)
         else:
-            self.action = SkipAction()
+            self.action = SkipAction.get()
     
     def checkFinishedCurrentIntention(self) -> bool:
         """
@@ -137,6 +149,7 @@ class Agent:
         """
 
         self.setObservation()
+        self.clearBidCache()
         self.intentionHandler.updateIntentionCoordinatesByOffset(offsetCoordinate)
     
     def normalizeCoordinates(self) -> None:
@@ -146,6 +159,7 @@ class Agent:
         """
 
         self.setObservation()
+        self.clearBidCache()
         self.intentionHandler.normalizeIntentionCoordinates()
     
     def setIntentionRole(self, role: AgentIntentionRole) -> None:
@@ -187,8 +201,12 @@ class Agent:
         `SimulationDataServer`.
         """
 
-        self.dynamicPerceptWrapper = DynamicPerceptWrapper(self.mapcAgent.dynamic["percept"],
-                            self.simDataServer.staticPercept.roles, self.mapcAgent.dynamic["step"])
+        # Fetch the percept once, every access waits for the connection's event loop
+        dynamic = self.mapcAgent.dynamic
+        step = dynamic["step"]
+
+        self.dynamicPerceptWrapper = DynamicPerceptWrapper(dynamic["percept"],
+                            self.simDataServer.staticPercept.roles, step)
         self.mapcRole = self.simDataServer.staticPercept.roles[self.dynamicPerceptWrapper.role]
         mapUpdateData = MapUpdateData(
             self.dynamicPerceptWrapper.things,
@@ -197,85 +215,146 @@ class Agent:
             self.dynamicPerceptWrapper.goalZones,
             self.dynamicPerceptWrapper.roleZones
         )
-        self.mapServer.updateMap(self.id, self.mapcAgent.dynamic["step"], mapUpdateData)
-        self.simDataServer.setSimulationStep(self.mapcAgent.dynamic["step"])
+        self.mapServer.updateMap(self.id, step, mapUpdateData)
+        self.simDataServer.setSimulationStep(step)
         self.simDataServer.setAgentMaxEnegy(self.dynamicPerceptWrapper.energy)
 
         # Maintain attached entity list
-        for attachedEntity in list(self.attachedEntities):
-            if attachedEntity.relCoord not in self.dynamicPerceptWrapper.attached:
+        if self.attachedEntities:
+            perceptAttachedRelCoords = set(self.dynamicPerceptWrapper.attached)
+            notAttachedEntities = [e for e in self.attachedEntities if e.relCoord not in perceptAttachedRelCoords]
+            for attachedEntity in notAttachedEntities:
                 self.removeNotConnectedEntities(attachedEntity)
 
         self.simDataServer.updateTasks(self.dynamicPerceptWrapper.tasks)
         self.simDataServer.updateNorms(self.dynamicPerceptWrapper.norms)
         self.setObservation()
+        self.clearBidCache()
 
-    def executeAction(self) -> str:
+    async def executeAction(self) -> str | None:
         """
         Executes the planned `AgentAction`
         and returns the response of it.
         """
 
-        return self.action.perform(self.mapcAgent)
+        return await self.action.performAsync(self.mapcAgent)
 
     def processActionResult(self, actionResult: str) -> None:
         """
         Processes the result of the executed `AgentAction`.
+        The handler is selected by the type of the action.
+        """
+
+        handler = Agent.actionResultHandlers.get(type(self.action))
+        if handler is not None:
+            handler(self, actionResult)
+
+    def processMoveActionResult(self, actionResult: str) -> None:
+        """
+        Updates the `Agent` position after a `MoveAction`.
+        """
+
+        map = self.mapServer.getMap(self.id)
+        currentCoord = map.getAgentCoordinate(self.id)
+        
+        # The position is changed, the stored bid results are outdated
+        self.clearBidCache()
+
+        # Move all the Coordinates
+        if actionResult == "success":
+            currentCoord.move(self.action.directions)
+            map.setAgentCoordinate(self.id, currentCoord)
+        
+        # Else just the first one, because max is 2, failed is 0, then partial is 1
+        elif actionResult == "partial_success":
+            currentCoord.move([(self.action.directions[0])])
+            map.setAgentCoordinate(self.id, currentCoord)
+
+    def processRotateActionResult(self, actionResult: str) -> None:
+        """
+        Rotates the attached entities after a `RotateAction`.
         """
 
-        if isinstance(self.action, MoveAction):
-            map = self.mapServer.getMap(self.id)
-            currentCoord = map.getAgentCoordinate(self.id)
-            
-            # Move all the Coordinates
-            if actionResult == "success":
-                currentCoord.move(self.action.directions)
-                map.setAgentCoordinate(self.id, currentCoord)
-            
-            # Else just the first one, because max is 2, failed is 0, then partial is 1
-            elif actionResult == "partial_success":
-                currentCoord.move([(self.action.directions[0])])
-                map.setAgentCoordinate(self.id, currentCoord)
-
-        elif isinstance(self.action, RotateAction) and actionResult == "success":
+        if actionResult == "success":
             # Rotate all attached entities in the list
             for attachedEntity in self.attachedEntities:
                 attachedEntity.relCoord.rotateRelCoord(self.action.rotateDirection)
 
-        elif isinstance(self.action, AttachAction) and actionResult == "success":
+    def processAttachActionResult(self, actionResult: str) -> None:
+        """
+        Stores the new attached entity after an `AttachAction`.
+        """
+
+        if actionResult == "success":
             # Update the attached entity list
             self.attachedEntities.append(AttachedEntity(
                 Coordinate.getRelativeCoordinateByDirection(self.action.direction),
                 self.action.entityType,
                 self.action.details))
 
-        elif isinstance(self.action, DetachAction) and actionResult == "success":
+    def processDetachActionResult(self, actionResult: str) -> None:
+        """
+        Removes the detached entities after a `DetachAction`.
+        """
+
+        if actionResult == "success":
             # Update the attached entity list
-            detachedRelCoord = Coordinate.origo().getMovedCoord([self.action.direction], False)
+            detachedRelCoord = Coordinate.getRelativeCoordinateByDirection(self.action.direction)
             detachedAttachedEntity = next(filter(lambda e: e.relCoord == detachedRelCoord, self.attachedEntities), None)
 
             if detachedAttachedEntity is not None:
                 self.removeNotConnectedEntities(detachedAttachedEntity)
 
-        elif isinstance(self.action, AdoptAction) and actionResult == "success":
+    def processAdoptActionResult(self, actionResult: str) -> None:
+        """
+        Stores the new role after an `AdoptAction`.
+        """
+
+        if actionResult == "success":
             # Send the role change information to the SimulationDataServer
             self.simDataServer.switchRoleForAgent(self.id, self.action.roleName)
 
-        elif isinstance(self.action, ConnectAction) and actionResult == "success":
-            # Update the attached entity list, BUT with only one element
-            # the rest of them is not calculated, because it will detach instantly after
-            # this action. TODO: calculate the rest, because this can cause bugs
-            if self.action.toAttachedEntity is not None:
-                self.attachedEntities.append(self.action.toAttachedEntity)
-                self.connectAttachedEntities(self.action.relCoord, self.action.toAttachedEntity)
+    def processConnectActionResult(self, actionResult: str) -> None:
+        """
+        Stores the connected entity after a `ConnectAction`.
+        """
+
+        # Update the attached entity list, BUT with only one element
+        # the rest of them is not calculated, because it will detach instantly after
+        # this action. TODO: calculate the rest, because this can cause bugs
+        if actionResult == "success" and self.action.toAttachedEntity is not None:
+            self.attachedEntities.append(self.action.toAttachedEntity)
+            self.connectAttachedEntities(self.action.relCoord, self.action.toAttachedEntity)
 
-        elif isinstance(self.action, DisconnectAction) and actionResult == "success":
+    def processDisconnectActionResult(self, actionResult: str) -> None:
+        """
+        Handles the result of a `DisconnectAction`.
+        """
+
+        if actionResult == "success":
             raise NotImplementedError("Disconnect handle") # TODO: Handle this action if needed
 
-        elif isinstance(self.action, SubmitAction) and actionResult == "success":
+    def processSubmitActionResult(self, actionResult: str) -> None:
+        """
+        Clears the attached entities after a `SubmitAction`.
+        """
+
+        if actionResult == "success":
             # Clear the attached list, only valid if
             # the submittor has only Task related attached entities
             self.attachedEntities.clear()
+
+    # Action result handlers by action type, the rest of the actions need no processing
+    actionResultHandlers = {
+        MoveAction: processMoveActionResult,
+        RotateAction: processRotateActionResult,
+        AttachAction: processAttachActionResult,
+        DetachAction: processDetachActionResult,
+        AdoptAction: processAdoptActionResult,
+        ConnectAction: processConnectActionResult,
+        DisconnectAction: processDisconnectActionResult,
+        SubmitAction: processSubmitActionResult
+    }
     
     def setDynamicPerceptAfterAction(self, actionResult: str) -> None:
         """
@@ -314,12 +393,58 @@ class Agent:
         dynamicMap = self.mapServer.getMap(self.id)
         self.observation = Observation(self.id, self.simDataServer, dynamicMap, self.mapcRole,
             self.dynamicPerceptWrapper.energy, self.dynamicPerceptWrapper.deactivated,
-            AgentActionEnum[self.dynamicPerceptWrapper.lastAction.upper()] \
-                if self.dynamicPerceptWrapper.lastAction.upper() in [str(a) for a in AgentActionEnum] else AgentActionEnum.SKIP,
+            AgentActionEnum.__members__.get(self.dynamicPerceptWrapper.lastAction.upper(), AgentActionEnum.SKIP),
             self.dynamicPerceptWrapper.lastActionResult,
             self.attachedEntities, self.dynamicPerceptWrapper.attached,
             self.dynamicPerceptWrapper)
 
+    def clearBidCache(self) -> None:
+        """
+        Drops the stored current `Coordinate`, closest role zones and dispensers,
+        because the map or the `Coordinates` have been changed.
+        """
+
+        self.bidCache.clear()
+        self.bidAgentCoordinate = None
+
+    def getAgentCoordinateForBid(self, currentMap: DynamicMap) -> Coordinate:
+        """
+        Returns the current `Coordinate` of the `Agent`.
+        It is read only once per step, though the `Agent`
+        bids for every startable `Task`.
+        """
+
+        if self.bidAgentCoordinate is None:
+            self.bidAgentCoordinate = currentMap.getAgentCoordinate(self.id)
+
+        return self.bidAgentCoordinate
+
+    def getClosestRoleZoneForBid(self, currentMap: DynamicMap, coordinate: Coordinate) -> Coordinate | None:
+        """
+        Returns the closest role zone to the given `Coordinate`.
+        It is searched only once per step, though the `Agent`
+        bids for every startable `Task`.
+        """
+
+        key = (None, coordinate.x, coordinate.y)
+        if key not in self.bidCache:
+            self.bidCache[key] = currentMap.getClosestRoleZone(coordinate)
+        
+        return self.bidCache[key]
+
+    def getClosestDispenserForBid(self, currentMap: DynamicMap, type: str, coordinate: Coordinate) -> Coordinate | None:
+        """
+        Returns the closest given type of `Dispenser` to the given `Coordinate`.
+        It is searched only once per step, though the `Agent`
+        bids for every startable `Task`.
+        """
+
+        key = (type, coordinate.x, coordinate.y)
+        if key not in self.bidCache:
+            self.bidCache[key] = currentMap.getClosestDispenser(type, coordinate)
+        
+        return self.bidCache[key]
+
     def bidGoalZone(self, blockRelCoords: list[Coordinate]) -> float:
         """
         Returns an estimation how much step is needed
@@ -328,19 +453,20 @@ class Agent:
         """
 
         currentMap = self.mapServer.getMap(self.id)
-        agentCurrentCoordinate = currentMap.getAgentCoordinate(self.id)
+        agentCurrentCoordinate = self.getAgentCoordinateForBid(currentMap)
+        freeSpeedCost = len(blockRelCoords) * self.mapcRole.getFreeSpeed()
 
         # If the agent has a coordinator role then no need to get a new role
         if self.mapcRole in self.simDataServer.getCoordinatorRoles():
             return Coordinate.distance(agentCurrentCoordinate, currentMap.getClosestFreeGoalZoneForTask(agentCurrentCoordinate, blockRelCoords)) + \
-                len(blockRelCoords) * self.mapcRole.getFreeSpeed()
-        
+                freeSpeedCost
+
         # Else it has to travel to a role zone
         else:
-            roleZoneCoord = currentMap.getClosestRoleZone(agentCurrentCoordinate)
+            roleZoneCoord = self.getClosestRoleZoneForBid(currentMap, agentCurrentCoordinate)
             return 1 + Coordinate.distance(agentCurrentCoordinate, roleZoneCoord) + \
                 Coordinate.distance(roleZoneCoord, currentMap.getClosestFreeGoalZoneForTask(roleZoneCoord, blockRelCoords)) + \
-                    len(blockRelCoords) * self.mapcRole.getFreeSpeed()
+                    freeSpeedCost
 
     def bidDispenser(self, type: str, goalZoneCoord: Coordinate) -> float:
         """
@@ -350,38 +476,37 @@ class Agent:
         """
 
         currentMap = self.mapServer.getMap(self.id)
-        agentCurrentCoordinate = currentMap.getAgentCoordinate(self.id)
+        agentCurrentCoordinate = self.getAgentCoordinateForBid(currentMap)
+
+        freeSpeed = self.mapcRole.getFreeSpeed()
+        blockSpeed = self.mapcRole.getSpeed(1)
+
+        # If has only the right block then travelling to the Dispenser is not required
+        hasTheBlock = len(self.attachedEntities) == 1 and \
+            self.attachedEntities[0].entityType == MapValueEnum.BLOCK and self.attachedEntities[0].details == type
 
         # If the agent has a block provider role then no need to get a new role
         if self.mapcRole in self.simDataServer.getBlockProviderRoles():
-            if len(self.attachedEntities) == 1:
-                attachedEntity = self.attachedEntities[0]
-                
-                # If has the right block then travelling to the Dispenser is not required
-                if attachedEntity.entityType == MapValueEnum.BLOCK and attachedEntity.details == type:
-                   return Coordinate.manhattanDistance(agentCurrentCoordinate, goalZoneCoord) / self.mapcRole.getSpeed(1)
-            
-            dispenserCoord = currentMap.getClosestDispenser(type, agentCurrentCoordinate)
-            return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, dispenserCoord) / self.mapcRole.getFreeSpeed() + \
-                 Coordinate.manhattanDistance(dispenserCoord, goalZoneCoord) / self.mapcRole.getSpeed(1)
-        
+            if hasTheBlock:
+                return Coordinate.manhattanDistance(agentCurrentCoordinate, goalZoneCoord) / blockSpeed
+
+            dispenserCoord = self.getClosestDispenserForBid(currentMap, type, agentCurrentCoordinate)
+            return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, dispenserCoord) / freeSpeed + \
+                 Coordinate.manhattanDistance(dispenserCoord, goalZoneCoord) / blockSpeed
+
         # Else it has to travel to a role zone
         else:
-            roleZoneCoord = currentMap.getClosestRoleZone(agentCurrentCoordinate)
+            roleZoneCoord = self.getClosestRoleZoneForBid(currentMap, agentCurrentCoordinate)
             roleZoneCoordDistance = Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord)
 
-            if len(self.attachedEntities) == 1:
-                attachedEntity = self.attachedEntities[0]
-
-                # If has the right block then travelling to the Dispenser is not required
-                if attachedEntity.entityType == MapValueEnum.BLOCK and attachedEntity.details == type:
-                   return 1 + roleZoneCoordDistance / self.mapcRole.getSpeed(1) + Coordinate.manhattanDistance(roleZoneCoord,goalZoneCoord) / self.mapcRole.getSpeed(1)
+            if hasTheBlock:
+                return 1 + roleZoneCoordDistance / blockSpeed + Coordinate.manhattanDistance(roleZoneCoord,goalZoneCoord) / blockSpeed
 
             # Else need to travel to the right Dispenser too
-            dispenserCoord = currentMap.getClosestDispenser(type, roleZoneCoord)
+            dispenserCoord = self.getClosestDispenserForBid(currentMap, type, roleZoneCoord)
 
-            return 2 + roleZoneCoordDistance / self.mapcRole.getFreeSpeed() + Coordinate.manhattanDistance(roleZoneCoord, dispenserCoord) / self.mapcRole.getFreeSpeed() + \
-                Coordinate.manhattanDistance(dispenserCoord, goalZoneCoord) / self.mapcRole.getSpeed(1)
+            return 2 + roleZoneCoordDistance / freeSpeed + Coordinate.manhattanDistance(roleZoneCoord, dispenserCoord) / freeSpeed + \
+                Coordinate.manhattanDistance(dispenserCoord, goalZoneCoord) / blockSpeed
 
     def bidSingleBlock(self, type: str, blockRelCoords: list[Coordinate]) -> float:
         """
@@ -391,59 +516,63 @@ class Agent:
         """
 
         currentMap = self.mapServer.getMap(self.id)
-        agentCurrentCoordinate = currentMap.getAgentCoordinate(self.id)
+        agentCurrentCoordinate = self.getAgentCoordinateForBid(currentMap)
+
+        freeSpeed = self.mapcRole.getFreeSpeed()
+        blockSpeed = self.mapcRole.getSpeed(1)
 
         singleBlockProviderRoles = self.simDataServer.getSingleBlockProviderRoles()
-        blockProviderRoles = self.simDataServer.getBlockProviderRoles()
-        coordinatorRoles = self.simDataServer.getCoordinatorRoles()
 
         # Check if the only attached Block is the right type
         if len(self.attachedEntities) == 1:
             attachedEntity = self.attachedEntities[0]
+            hasSuitableRole = self.mapcRole in singleBlockProviderRoles or \
+                self.mapcRole in self.simDataServer.getBlockProviderRoles()
+
             if attachedEntity.entityType == MapValueEnum.BLOCK and attachedEntity.details == type:
                 # The right Block is already attached
 
                 # If current role is fine then calculate the cost
-                if self.mapcRole in singleBlockProviderRoles or self.mapcRole in blockProviderRoles:
-                    return Coordinate.manhattanDistance(agentCurrentCoordinate, currentMap.getClosestFreeGoalZoneForTask(agentCurrentCoordinate, blockRelCoords)) / self.mapcRole.getSpeed(1)
-                
+                if hasSuitableRole:
+                    return Coordinate.manhattanDistance(agentCurrentCoordinate, currentMap.getClosestFreeGoalZoneForTask(agentCurrentCoordinate, blockRelCoords)) / blockSpeed
+
                 # Else have to search a role zone too
                 else:
-                    roleZoneCoord = currentMap.getClosestRoleZone(agentCurrentCoordinate)
-                    return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord) / self.mapcRole.getSpeed(1) + \
-                        Coordinate.manhattanDistance(roleZoneCoord, currentMap.getClosestDispenser(type, roleZoneCoord)) / self.mapcRole.getSpeed(1) 
-            
+                    roleZoneCoord = self.getClosestRoleZoneForBid(currentMap, agentCurrentCoordinate)
+                    return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord) / blockSpeed + \
+                        Coordinate.manhattanDistance(roleZoneCoord, self.getClosestDispenserForBid(currentMap, type, roleZoneCoord)) / blockSpeed
+
             # Else have to find the right type of Dispenser
             else:
                 # If current role is fine then calculate the cost
-                if self.mapcRole in singleBlockProviderRoles or self.mapcRole in blockProviderRoles:
-                    dispenserCoord = currentMap.getClosestDispenser(type, agentCurrentCoordinate)
-                    return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, dispenserCoord) / self.mapcRole.getFreeSpeed() + \
-                        Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / self.mapcRole.getSpeed(1)
-                
+                if hasSuitableRole:
+                    dispenserCoord = self.getClosestDispenserForBid(currentMap, type, agentCurrentCoordinate)
+                    return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, dispenserCoord) / freeSpeed + \
+                        Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / blockSpeed
+
                 # Else have to search a role zone too
                 else:
-                    roleZoneCoord = currentMap.getClosestRoleZone(agentCurrentCoordinate)
-                    dispenserCoord = currentMap.getClosestDispenser(type, roleZoneCoord)
-                    return 3 + Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord) / self.mapcRole.getFreeSpeed() + \
-                        Coordinate.manhattanDistance(roleZoneCoord, dispenserCoord) / self.mapcRole.getFreeSpeed() + \
-                        Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / self.mapcRole.getSpeed(1) 
+                    roleZoneCoord = self.getClosestRoleZoneForBid(currentMap, agentCurrentCoordinate)
+                    dispenserCoord = self.getClosestDispenserForBid(currentMap, type, roleZoneCoord)
+                    return 3 + Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord) / freeSpeed + \
+                        Coordinate.manhattanDistance(roleZoneCoord, dispenserCoord) / freeSpeed + \
+                        Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / blockSpeed
 
         # Else have the wrong Blocks
         else:
             # If current role is fine then calculate the cost
-            if self.mapcRole in singleBlockProviderRoles or self.mapcRole in coordinatorRoles:
-                dispenserCoord = currentMap.getClosestDispenser(type, agentCurrentCoordinate)
-                return 1 + Coordinate.manhattanDistance(agentCurrentCoordinate, dispenserCoord) / self.mapcRole.getFreeSpeed() + \
-                    Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / self.mapcRole.getSpeed(1)
-            
+            if self.mapcRole in singleBlockProviderRoles or self.mapcRole in self.simDataServer.getCoordinatorRoles():
+                dispenserCoord = self.getClosestDispenserForBid(currentMap, type, agentCurrentCoordinate)
+                return 1 + Coordinate.manhattanDistance(agentCurrentCoordinate, dispenserCoord) / freeSpeed + \
+                    Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / blockSpeed
+
             # Else have to search a role zone too
             else:
-                roleZoneCoord = currentMap.getClosestRoleZone(agentCurrentCoordinate)
-                dispenserCoord = currentMap.getClosestDispenser(type, roleZoneCoord)
-                return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord) / self.mapcRole.getFreeSpeed() + \
-                    Coordinate.manhattanDistance(roleZoneCoord, dispenserCoord) / self.mapcRole.getFreeSpeed() + \
-                    Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / self.mapcRole.getSpeed(1)
+                roleZoneCoord = self.getClosestRoleZoneForBid(currentMap, agentCurrentCoordinate)
+                dispenserCoord = self.getClosestDispenserForBid(currentMap, type, roleZoneCoord)
+                return 2 + Coordinate.manhattanDistance(agentCurrentCoordinate, roleZoneCoord) / freeSpeed + \
+                    Coordinate.manhattanDistance(roleZoneCoord, dispenserCoord) / freeSpeed + \
+                    Coordinate.manhattanDistance(dispenserCoord, currentMap.getClosestFreeGoalZoneForTask(dispenserCoord, blockRelCoords)) / blockSpeed
 
     def explain(self) -> str:
         """
@@ -467,11 +596,16 @@ class Agent:
         that are attached to the removed one.
         """
 
-        for furtherAttachedEntity in removedAttachedEntity.attachedEntities:
-            self.removeNotConnectedEntities(furtherAttachedEntity)
-        
-        if removedAttachedEntity in self.attachedEntities:
-            self.attachedEntities.remove(removedAttachedEntity)
+        # Collect the removed one and everything attached to it
+        removedEntityIds = set()
+        entitiesToVisit = [removedAttachedEntity]
+        while entitiesToVisit:
+            attachedEntity = entitiesToVisit.pop()
+            removedEntityIds.add(id(attachedEntity))
+            entitiesToVisit.extend(attachedEntity.attachedEntities)
+
+        # Remove them in one pass, the list is shared with the Observation
+        self.attachedEntities[:] = [e for e in self.attachedEntities if id(e) not in removedEntityIds]
     
     def connectAttachedEntities(self, fromRelCoord: Coordinate, attachedEntity: AttachedEntity) -> None:
         """
@@ -10,6 +10,14 @@ from agent.intention.commonIntentions import IdleIntention, EscapeIntention
 from agent.intention.blockProviderIntentions import BlockProvidingIntention, SingleBlockProvidingIntention
 from agent.intention.coordinatorIntentions import CoordinationIntention
 
+# Intention types checked every step, the intention classes are not subclassed further,
+# so comparing the exact type is enough
+taskIntentionTypes = frozenset((BlockProvidingIntention, SingleBlockProvidingIntention, CoordinationIntention))
+droppableIntentionTypes = frozenset((CoordinationIntention, SingleBlockProvidingIntention))
+
+# Intention roles of the Agents who are working on a Task
+taskIntentionRoles = frozenset((AgentIntentionRole.COORDINATOR, AgentIntentionRole.BLOCKPROVIDER, AgentIntentionRole.SINGLEBLOCKPROVIDER))
+
 class IntentionHandler():
     """
     Intention container which prioritizes `MainAgentIntentions`
@@ -20,6 +28,7 @@ class IntentionHandler():
 
     agentId: str
     intentions: PriorityQueue
+    intentionTypeCounts: dict[type, int]           # Count of the intentions in the queue by their type
     currentIntention: MainAgentIntention | None
     intentionRole: AgentIntentionRole
     hasToDropCurrentTask: bool                      # Contains if has to drop its current Task 
@@ -29,6 +38,7 @@ class IntentionHandler():
         self.agentId = agentId
 
         self.intentions = PriorityQueue()
+        self.intentionTypeCounts = dict()
         self.initializeBaseIntention()
         self.currentIntention = None
 
@@ -41,6 +51,7 @@ class IntentionHandler():
         """
 
         self.intentions.insert(PriorityQueueNode(intention, intention.getPriority()))
+        self.intentionTypeCounts[type(intention)] = self.intentionTypeCounts.get(type(intention), 0) + 1
     
     def isCurrentIntentionRelatedToTask(self) -> bool:
         """
@@ -48,14 +59,15 @@ class IntentionHandler():
         providing block, coordinating or single block providing
         """
 
-        return isinstance(self.currentIntention, (BlockProvidingIntention, SingleBlockProvidingIntention, CoordinationIntention))
+        return type(self.currentIntention) in taskIntentionTypes
     
     def finishCurrentIntention(self) -> None:
         """
         Finishes its first intention, removes from the queue.
         """
 
-        self.intentions.pop()
+        finishedIntentionType = type(self.intentions.pop().value)
+        self.intentionTypeCounts[finishedIntentionType] -= 1
         self.currentIntention = None
     
     def getCurrentIntention(self) -> MainAgentIntention | None:
@@ -72,8 +84,7 @@ class IntentionHandler():
         """
 
         if self.isAgentInMarkerCoords(observation) and not self.hasGivenTypeOfIntention(EscapeIntention):
-            escapeInt = EscapeIntention()
-            self.intentions.insert(PriorityQueueNode(escapeInt, escapeInt.getPriority()))
+            self.insertIntention(EscapeIntention())
 
     def filterOptions(self) -> MainAgentIntention:
         """
@@ -82,34 +93,51 @@ class IntentionHandler():
         """
 
         # If has to drop Task then drop it before choosing an another intention
-        if self.hasToDropCurrentTask and self.currentIntention is not None and \
-            isinstance(self.currentIntention, (CoordinationIntention, SingleBlockProvidingIntention)):
+        if self.hasToDropCurrentTask and type(self.currentIntention) in droppableIntentionTypes:
 
             self.currentIntention.startDroppingIntention()
 
         # Select the current intention
         currentIntention = self.intentions.head().value
 
-        # If it is an escape (clear event) set the required flags
-        if isinstance(currentIntention, EscapeIntention):
-            # If coordinator then drop the Task and release the blockProviders
-            if isinstance(self.currentIntention, CoordinationIntention):
-                self.currentIntention.releaseProviders()
-                self.currentIntention.startDroppingIntention()
-            
-            # If single block provider then just set own flags
-            elif isinstance(self.currentIntention, BlockProvidingIntention) and self.currentIntention.isDeliveringBlock():
-                self.currentIntention.setEscapeFlags()
+        # Let the previous intention react to the change (e.g. escape from a clear event)
+        transition = IntentionHandler.intentionTransitions.get((type(self.currentIntention), type(currentIntention)))
+        if transition is not None:
+            transition(self)
 
         self.currentIntention = currentIntention
         return self.currentIntention
+
+    def escapeFromCoordination(self) -> None:
+        """
+        Drops the `Task` of the current `CoordinationIntention`
+        and releases its block providers before escaping.
+        """
+
+        self.currentIntention.releaseProviders()
+        self.currentIntention.startDroppingIntention()
+
+    def escapeFromBlockProviding(self) -> None:
+        """
+        Sets the escape flags of the current `BlockProvidingIntention`
+        if it is delivering its block.
+        """
+
+        if self.currentIntention.isDeliveringBlock():
+            self.currentIntention.setEscapeFlags()
+
+    # Handlers by (previous intention type, selected intention type), other pairs need no action
+    intentionTransitions = {
+        (CoordinationIntention, EscapeIntention): escapeFromCoordination,
+        (BlockProvidingIntention, EscapeIntention): escapeFromBlockProviding
+    }
     
     def updateIntentionCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
         """
         Shifts the all the `Coordinates` in all intentions recursively.
         """
 
-        for intention in self.intentions.getValues():
+        for intention in self.intentions:
             intention.updateCoordinatesByOffset(offsetCoordinate)
     
     def normalizeIntentionCoordinates(self) -> None:
@@ -117,7 +145,7 @@ class IntentionHandler():
         Normalizes all the `Coordinates` in all intentions recursively.
         """
 
-        for intention in self.intentions.getValues():
+        for intention in self.intentions:
             intention.normalizeCoordinates()
     
     def setIntentionRole(self, role: AgentIntentionRole) -> None:
@@ -140,7 +168,7 @@ class IntentionHandler():
         related to a `Task` by the current `AgentIntentionRole`.
         """
 
-        return self.intentionRole in [AgentIntentionRole.COORDINATOR, AgentIntentionRole.BLOCKPROVIDER, AgentIntentionRole.SINGLEBLOCKPROVIDER]
+        return self.intentionRole in taskIntentionRoles
     
     def abandonCurrentTask(self) -> None:
         """
@@ -149,7 +177,7 @@ class IntentionHandler():
         """
 
         # If the current one is a Task related then send the signal
-        if self.currentIntention is not None and isinstance(self.currentIntention, (CoordinationIntention, SingleBlockProvidingIntention)):
+        if type(self.currentIntention) in droppableIntentionTypes:
             self.currentIntention.startDroppingIntention()
         
         # Else set the flag, so later can be sent
@@ -159,9 +187,10 @@ class IntentionHandler():
     def hasGivenTypeOfIntention(self, type: Type) -> bool:
         """
         Returns if has the given type of `MainAgentIntention`.
+        The exact type is compared, subclasses are not matched.
         """
 
-        return any(isinstance(i, type) for i in self.intentions.getValues())
+        return self.intentionTypeCounts.get(type, 0) > 0
     
     def initializeBaseIntention(self) -> None:
         """
@@ -169,13 +198,9 @@ class IntentionHandler():
         and `IdleIntention` intentsions.
         """
         
-        exploreInt = ExploreIntention()
-        updateMapInt = UpdateMapIntention()
-        idleInt = IdleIntention()
-
-        self.intentions.insert(PriorityQueueNode(exploreInt, exploreInt.getPriority()))
-        self.intentions.insert(PriorityQueueNode(updateMapInt, updateMapInt.getPriority()))
-        self.intentions.insert(PriorityQueueNode(idleInt, idleInt.getPriority()))
+        self.insertIntention(ExploreIntention())
+        self.insertIntention(UpdateMapIntention())
+        self.insertIntention(IdleIntention())
     
     def isAgentInMarkerCoords(self, observation: Observation) -> bool:
         """
@@ -183,8 +208,9 @@ class IntentionHandler():
         are in a clear event.
         """
 
+        markers = observation.map.markers
         agentCurrentCoord = observation.agentCurrentCoordinate
-        involvedCoords = [agentCurrentCoord]
-        involvedCoords.extend([agentCurrentCoord.getShiftedCoordinate(e.relCoord) for e in observation.agentData.attachedEntities])
+        if agentCurrentCoord in markers:
+            return True
 
-        return any(c in observation.map.markers for c in involvedCoords)
\ No newline at end of file
+        return any(agentCurrentCoord.getShiftedCoordinate(e.relCoord) in markers for e in observation.agentData.attachedEntities)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from abc import ABC, abstractclassmethod
+from abc import ABC, abstractmethod
 
 from data.coreData import Coordinate
 
@@ -20,14 +20,14 @@ class AgentIntention(ABC):
     which can be used for debugging.
     """
 
-    @abstractclassmethod
+    @abstractmethod
     async def planNextAction(self, observation: Observation) -> AgentAction:
         """
         Plans and returns the next action to reach its goal.
         """
         pass
 
-    @abstractclassmethod
+    @abstractmethod
     def checkFinished(self, observation: Observation) -> bool:
         """
         Returns if it has reached its goal.
@@ -35,7 +35,7 @@ class AgentIntention(ABC):
 
         pass
 
-    @abstractclassmethod
+    @abstractmethod
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
         """
         Shifts the `Coordinates` inside it by the given one.
@@ -43,7 +43,7 @@ class AgentIntention(ABC):
 
         pass
     
-    @abstractclassmethod
+    @abstractmethod
     def normalizeCoordinates(self) -> None:
         """
         Normalized the `Coordinates` inside it.
@@ -51,7 +51,7 @@ class AgentIntention(ABC):
 
         pass
 
-    @abstractclassmethod
+    @abstractmethod
     def explain(self) -> str:
         """
         Returns an explanation string used for debugging.
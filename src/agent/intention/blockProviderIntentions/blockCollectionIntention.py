@@ -9,6 +9,9 @@ from agent.intention.commonIntentions import AgitatedTravelIntention, SkipIntent
 
 from agent.action import AgentAction, RequestAction, AttachAction, DetachAction, ClearAction
 
+# Intention roles which collect Blocks from Dispensers
+blockCollectorIntentionRoles = frozenset((AgentIntentionRole.BLOCKPROVIDER, AgentIntentionRole.SINGLEBLOCKPROVIDER))
+
 class BlockCollectionIntention(AgentIntention):
     """
     Intention to collect the given `Block` type,
@@ -25,7 +28,7 @@ class BlockCollectionIntention(AgentIntention):
 
     def __init__(self, blockType: str, intentionDataServer: IntentionDataServer) -> None:
         self.agitatedTravelIntention = None
-        self.skipIntention = SkipIntention(True)
+        self.skipIntention = SkipIntention.get(True)
 
         self.closestDispenserCoord = None
         self.blockType = blockType
@@ -36,21 +39,24 @@ class BlockCollectionIntention(AgentIntention):
         if self.closestDispenserCoord is not None and self.hasAttachedMultipleEntities(observation):
             return await self.handleMultipleAttachedStuck(observation)
 
+        # The agent Coordinate is looked up (and copied) from the map on every access
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
+
         # Get closest dispenser Coordinate
         closestDispenserCoord = observation.map.getClosestDispenser(
-            self.blockType, observation.agentCurrentCoordinate)
+            self.blockType, agentCurrentCoordinate)
 
         # Get closest abandoned Block Coordinate
         freeBlockCoord = self.getFreeBlockCoord(observation)
         
         # If abandoned Block is closer than Dispenser then target that
         if freeBlockCoord is not None and \
-            (Coordinate.manhattanDistance(observation.agentCurrentCoordinate, freeBlockCoord) < Coordinate.manhattanDistance(observation.agentCurrentCoordinate, closestDispenserCoord)):
+            (Coordinate.manhattanDistance(agentCurrentCoordinate, freeBlockCoord) < Coordinate.manhattanDistance(agentCurrentCoordinate, closestDispenserCoord)):
             
             closestDispenserCoord = freeBlockCoord.copy()
 
-        # Travel to the Dispenser / Block
-        if (closestDispenserCoord not in observation.agentCurrentCoordinate.neighbors()):
+        # Travel to the Dispenser / Block (it has to be adjacent)
+        if Coordinate.manhattanDistance(agentCurrentCoordinate, closestDispenserCoord) != 1:
             return await self.travelToClosestDispenser(observation, closestDispenserCoord)
 
         self.closestDispenserCoord = closestDispenserCoord
@@ -58,17 +64,17 @@ class BlockCollectionIntention(AgentIntention):
         # If the target area is occupied by an another Block, then clear it
         target = observation.map.getMapValue(self.closestDispenserCoord)
         if target.value == MapValueEnum.BLOCK and target.details != self.blockType:
-            return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, self.closestDispenserCoord))
+            return ClearAction(Coordinate.getRelativeCoordinate(agentCurrentCoordinate, self.closestDispenserCoord))
 
         # Else try to attach the Block
         if target.value == MapValueEnum.BLOCK and target.details == self.blockType:
             return await self.attemptAttachBlock(observation)
         # If the dispenser is empty, then request a Block from it
         else:
-            return RequestAction(Coordinate.getDirection(observation.agentCurrentCoordinate, self.closestDispenserCoord))
+            return RequestAction(Coordinate.getDirection(agentCurrentCoordinate, self.closestDispenserCoord))
 
     def checkFinished(self, observation: Observation) -> bool:
-        return observation.agentData.lastAction == AgentActionEnum.ATTACH and observation.agentData.lastActionSucceeded and \
+        return observation.agentData.lastAction is AgentActionEnum.ATTACH and observation.agentData.lastActionSucceeded and \
             not self.hasAttachedMultipleEntities(observation)
     
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
@@ -103,14 +109,17 @@ class BlockCollectionIntention(AgentIntention):
         are attaching the same `Block`, they will get stuck together.
         """
         
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
+
         # If the Agent isn't next to the Dispenser then skip
-        if Coordinate.manhattanDistance(observation.agentCurrentCoordinate, self.closestDispenserCoord) != 1:
+        if Coordinate.manhattanDistance(agentCurrentCoordinate, self.closestDispenserCoord) != 1:
             return False
 
-        # Else check for oher Agents
-        dispenserRelCoord = Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, self.closestDispenserCoord)
-        return any(filter(lambda c: observation.map.getMapValueEnum(observation.agentCurrentCoordinate.getShiftedCoordinate(c)) == MapValueEnum.AGENT,
-            set(dispenserRelCoord.neighbors(False)).intersection(observation.agentData.perceptAttachedRelCoords)))
+        # Else check for oher Agents at the attached Coordinates around the Dispenser
+        dispenserRelCoord = Coordinate.getRelativeCoordinate(agentCurrentCoordinate, self.closestDispenserCoord)
+        perceptAttachedRelCoords = observation.agentData.perceptAttachedRelCoords
+        return any(observation.map.getMapValueEnum(agentCurrentCoordinate.getShiftedCoordinate(c)) == MapValueEnum.AGENT
+            for c in dispenserRelCoord.neighbors(False) if c in perceptAttachedRelCoords)
     
     async def handleMultipleAttachedStuck(self, observation: Observation) -> AgentAction:
         """
@@ -132,15 +141,16 @@ class BlockCollectionIntention(AgentIntention):
         return await self.agitatedTravelIntention.planNextAction(observation)
     
     async def attemptAttachBlock(self, observation: Observation) -> AgentAction:
+        dispenserNeighbors = self.closestDispenserCoord.neighbors()
         otherAgentIdsAtDispenser = [id for id, c in observation.map.agentCoordinates.items()
-            if c in self.closestDispenserCoord.neighbors() and self.intentionDataServer.getAgentIntentionRole(id) in [AgentIntentionRole.BLOCKPROVIDER, AgentIntentionRole.SINGLEBLOCKPROVIDER]]
+            if c in dispenserNeighbors and self.intentionDataServer.getAgentIntentionRole(id) in blockCollectorIntentionRoles]
             
-        if any([a for a in otherAgentIdsAtDispenser if any(self.intentionDataServer.getAgentOservation(a).agentData.attachedEntities)]) or \
+        if any(self.intentionDataServer.getAgentOservation(a).agentData.attachedEntities for a in otherAgentIdsAtDispenser) or \
             len(otherAgentIdsAtDispenser) > 0 and min(otherAgentIdsAtDispenser) != observation.agentData.id:
                 
             return await self.skipIntention.planNextAction(observation)
 
-        return AttachAction(Coordinate.getDirection(observation.agentCurrentCoordinate, self.closestDispenserCoord), MapValueEnum.BLOCK, self.blockType)
+        return AttachAction.get(Coordinate.getDirection(observation.agentCurrentCoordinate, self.closestDispenserCoord), MapValueEnum.BLOCK, self.blockType)
 
     def getFreeBlockCoord(self, observation: Observation) -> Coordinate | None:
         """
@@ -148,23 +158,33 @@ class BlockCollectionIntention(AgentIntention):
         if one is found.
         """
 
-        blockCoords = []
-        for possibleBlockCoord in observation.agentCurrentCoordinate.neighbors(searchRange = observation.agentMapcRole.vision):
+        # The agent Coordinate is looked up (and copied) from the map on every access
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
+        map = observation.map
+        perceptAttachedRelCoords = observation.agentData.perceptAttachedRelCoords
+
+        # Keep the closest one (the first one on equal distance)
+        closestBlockCoord = None
+        closestBlockDistance = None
+        for possibleBlockCoord in agentCurrentCoordinate.neighbors(searchRange = observation.agentMapcRole.vision):
             # If it's from a dispenser then skip, it's not abandoned
-            if observation.map.getMapValueEnum(possibleBlockCoord, needDispenser = True) == MapValueEnum.DISPENSER:
+            if map.getMapValueEnum(possibleBlockCoord, needDispenser = True) == MapValueEnum.DISPENSER:
                 continue
 
-            coordValue = observation.map.getMapValue(possibleBlockCoord)
+            coordValue = map.getMapValue(possibleBlockCoord)
 
-           # If type does not match or it is attached then skip
+            # If type does not match or it is attached then skip
             if coordValue.value != MapValueEnum.BLOCK or coordValue.details != self.blockType or \
-                Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, possibleBlockCoord) in observation.agentData.perceptAttachedRelCoords:
+                Coordinate.getRelativeCoordinate(agentCurrentCoordinate, possibleBlockCoord) in perceptAttachedRelCoords:
                 continue
 
             # If probably attached (to an another block, or agent), or there's a marker around it then skip too
-            if any(observation.map.getMapValueEnum(n) in [MapValueEnum.BLOCK, MapValueEnum.AGENT, MapValueEnum.MARKER] for n in possibleBlockCoord.neighbors()):
+            if any(map.getMapValueEnum(n) in (MapValueEnum.BLOCK, MapValueEnum.AGENT, MapValueEnum.MARKER) for n in possibleBlockCoord.neighbors()):
                 continue
 
-            blockCoords.append(possibleBlockCoord)
+            distance = Coordinate.manhattanDistance(possibleBlockCoord, agentCurrentCoordinate)
+            if closestBlockDistance is None or distance < closestBlockDistance:
+                closestBlockCoord = possibleBlockCoord
+                closestBlockDistance = distance
         
-        return min(blockCoords, key = lambda coord: Coordinate.manhattanDistance(coord,observation.agentCurrentCoordinate), default = None) 
\ No newline at end of file
+        return closestBlockCoord
\ No newline at end of file
@@ -28,7 +28,7 @@ class BlockDeliveryIntention(AgentIntention):
     def __init__(self, toAgentId: str) -> None:
         self.distantAgitatedTravelIntention = None
         self.connectIntention = None
-        self.skipIntention = SkipIntention(True)
+        self.skipIntention = SkipIntention.get(True)
 
         self.toAgentId = toAgentId
         self.toAgentCurrentCoordinate = None
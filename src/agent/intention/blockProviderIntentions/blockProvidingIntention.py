@@ -2,6 +2,7 @@ from data.coreData import Coordinate, MapcRole
 from data.intention import Observation
 from data.server import IntentionDataServer
 
+from agent.intention.agentIntention import AgentIntention
 from agent.intention.mainAgentIntention import MainAgentIntention
 from agent.intention.commonIntentions import SkipIntention, AdoptRoleIntention, DetachBlocksIntention
 from agent.intention.blockProviderIntentions.blockCollectionIntention import BlockCollectionIntention
@@ -30,7 +31,7 @@ class BlockProvidingIntention(MainAgentIntention):
     def __init__(self, agentId: str, toAgentId: str, blockType: str, intentionDataServer: IntentionDataServer) -> None:
         self.blockCollectionIntention = None
         self.blockDeliveryIntention = None
-        self.skipIntention = SkipIntention(False)
+        self.skipIntention = SkipIntention.get(False)
         self.adoptRoleIntention = None
         self.detachBlockIntention = None
 
@@ -58,7 +59,7 @@ class BlockProvidingIntention(MainAgentIntention):
 
         # If just initialized check the currently attached entities
         if self.blockCollectionIntention is None and self.blockDeliveryIntention is None and \
-            any(observation.agentData.attachedEntities) and not self.hasTheBlock(observation):
+            observation.agentData.attachedEntities and not self.hasTheBlock(observation):
             
             # If has the wrong types of blocks then detach them
             return await self.releaseBlocks(observation)
@@ -66,7 +67,7 @@ class BlockProvidingIntention(MainAgentIntention):
         # If there are reserved roles for the Agent and it is not already adopted
         # then adopt it. It is required so the Agent can request, attach and connect Blocks
         agentRoles = observation.simDataServer.getReservedRolesForAgent(self.agentId)
-        if any(agentRoles) and observation.agentMapcRole != agentRoles[0]:
+        if agentRoles and observation.agentMapcRole != agentRoles[0]:
             return await self.planRoleAdoptPlan(observation, agentRoles[0])
 
         # Initialize blockCollectionIntention if have to
@@ -106,34 +107,20 @@ class BlockProvidingIntention(MainAgentIntention):
         return self.finishedCurrentProviding
     
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
-        if self.blockCollectionIntention is not None:
-            self.blockCollectionIntention.updateCoordinatesByOffset(offsetCoordinate)
-        
-        if self.blockDeliveryIntention is not None:
-            self.blockDeliveryIntention.updateCoordinatesByOffset(offsetCoordinate)
-        
-        self.skipIntention.updateCoordinatesByOffset(offsetCoordinate)
-
-        if self.adoptRoleIntention is not None:
-            self.adoptRoleIntention.updateCoordinatesByOffset(offsetCoordinate)
-        
-        if self.detachBlockIntention is not None:
-            self.detachBlockIntention.updateCoordinatesByOffset(offsetCoordinate)
+        for intention in self.getSubIntentions():
+            intention.updateCoordinatesByOffset(offsetCoordinate)
     
     def normalizeCoordinates(self) -> None:
-        if self.blockCollectionIntention is not None:
-            self.blockCollectionIntention.normalizeCoordinates()
-        
-        if self.blockDeliveryIntention is not None:
-            self.blockDeliveryIntention.normalizeCoordinates()
-        
-        self.skipIntention.normalizeCoordinates()
+        for intention in self.getSubIntentions():
+            intention.normalizeCoordinates()
 
-        if self.adoptRoleIntention is not None:
-            self.adoptRoleIntention.normalizeCoordinates()
-        
-        if self.detachBlockIntention is not None:
-            self.detachBlockIntention.normalizeCoordinates()
+    def getSubIntentions(self) -> list[AgentIntention]:
+        """
+        Returns the currently initialized sub intentions.
+        """
+
+        return [intention for intention in (self.blockCollectionIntention, self.blockDeliveryIntention, self.skipIntention,
+            self.adoptRoleIntention, self.detachBlockIntention) if intention is not None]
     
     def startConnection(self, blockRelCoord: Coordinate) -> None:
         """
@@ -191,8 +178,8 @@ class BlockProvidingIntention(MainAgentIntention):
         and if it is the only attached entity.
         """
 
-        return len(observation.agentData.attachedEntities) == 1 and \
-            observation.agentData.attachedEntities[0].details == self.blockType
+        attachedEntities = observation.agentData.attachedEntities
+        return len(attachedEntities) == 1 and attachedEntities[0].details == self.blockType
 
     async def releaseBlocks(self, observation : Observation) -> AgentAction:
         """
@@ -6,6 +6,15 @@ from agent.intention.commonIntentions import TravelIntention, SkipIntention
 
 from agent.action import AgentAction, DetachAction, ConnectAction, RotateAction, ClearAction
 
+# Map values which make a Coordinate unusable for the Block hand over
+occupiedMapValues = frozenset((MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER))
+# Map values which make the current travel target unreachable
+travelBlockingMapValues = frozenset((MapValueEnum.AGENT, MapValueEnum.BLOCK))
+# Map values which have to be cleared before rotating the Block there
+clearableMapValues = frozenset((MapValueEnum.OBSTACLE, MapValueEnum.BLOCK))
+# Map values where the Block can be rotated without clearing
+rotatableMapValues = frozenset((MapValueEnum.EMPTY, MapValueEnum.DISPENSER))
+
 class ConnectIntention(AgentIntention):
     """
     Intention to hand over a `Block` to an another
@@ -26,7 +35,7 @@ class ConnectIntention(AgentIntention):
 
     def __init__(self, toAgentId: str, blockRelCoord: Coordinate) -> None:
         self.travelIntention = None
-        self.skipIntention = SkipIntention(True)
+        self.skipIntention = SkipIntention.get(True)
 
         self.toAgentId = toAgentId
         self.toAgentCurrentCoord = None
@@ -44,7 +53,7 @@ class ConnectIntention(AgentIntention):
         # If just initialized or coordinat Agent's Coordinated changed or the current
         # travel intention is occoupied
         if self.travelIntention is None or self.toAgentCurrentCoord != toAgentCurrentCoord or \
-            observation.map.getMapValueEnum(self.travelIntention.coordinate) in [MapValueEnum.AGENT, MapValueEnum.BLOCK]:
+            observation.map.getMapValueEnum(self.travelIntention.coordinate) in travelBlockingMapValues:
             
             # Search for an another goal, from where the block hand over can be completed
             self.initializeTravelIntention(observation, toAgentCurrentCoord)
@@ -72,7 +81,7 @@ class ConnectIntention(AgentIntention):
             return await self.travelIntention.planNextAction(observation)
 
     def checkFinished(self, observation: Observation) -> bool:
-        return observation.agentData.lastAction == AgentActionEnum.DETACH and observation.agentData.lastActionSucceeded
+        return observation.agentData.lastAction is AgentActionEnum.DETACH and observation.agentData.lastActionSucceeded
     
     def isReadyForBlockHandover(self, observation: Observation) -> bool:
         """
@@ -80,9 +89,10 @@ class ConnectIntention(AgentIntention):
         the attached block is at the given `Coordinate`.
         """
 
+        attachedEntities = observation.agentData.attachedEntities
         return self.blockGoalCoord is not None \
-            and any(observation.agentData.attachedEntities) \
-                and self.blockGoalCoord == observation.agentCurrentCoordinate.getShiftedCoordinate(observation.agentData.attachedEntities[0].relCoord)
+            and len(attachedEntities) > 0 \
+                and self.blockGoalCoord == observation.agentCurrentCoordinate.getShiftedCoordinate(attachedEntities[0].relCoord)
     
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
         self.skipIntention.updateCoordinatesByOffset(offsetCoordinate)
@@ -114,25 +124,34 @@ class ConnectIntention(AgentIntention):
 
         self.toAgentCurrentCoord = toAgentCurrentCoord
         blockGoalCoord = self.toAgentCurrentCoord.getShiftedCoordinate(self.blockRelCoord)
+        blockGoalNeighbors = blockGoalCoord.neighbors()
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
+        map = observation.map
         travelIntentionGoal = None
 
         # If the Agent is already in a valid position then no need to search further
-        if observation.agentCurrentCoordinate in blockGoalCoord.neighbors():
-            travelIntentionGoal = observation.agentCurrentCoordinate
+        if agentCurrentCoordinate in blockGoalNeighbors:
+            travelIntentionGoal = agentCurrentCoordinate
         
         # Else search for a valid position
         else:
-            # Get all the Block destinations neighbors which are not occupied
+            # Choose the closest Block destination neighbor which is not occupied
             # and its surroundings are free so the Agent can rotate the Block
-            possibleTravelIntentionGoals = list(filter(lambda c: (c == observation.agentCurrentCoordinate
-                    or observation.map.getMapValueEnum(c) not in [MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER])
-                and any(observation.map.getMapValueEnum(n) not in [MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER] for n in c.neighbors()
-                    if n != blockGoalCoord and Coordinate.getDirection(blockGoalCoord, c) != Coordinate.getDirection(c, n)),
-                blockGoalCoord.neighbors()))
-                    
-            # If found any then the choose the closest
-            if any(possibleTravelIntentionGoals):
-                travelIntentionGoal = min(possibleTravelIntentionGoals, key = lambda c: Coordinate.distance(observation.agentCurrentCoordinate, c))
+            closestDistance = None
+            for c in blockGoalNeighbors:
+                if c != agentCurrentCoordinate and map.getMapValueEnum(c) in occupiedMapValues:
+                    continue
+
+                # The direction from the Block destination is the same for every neighbor of the candidate
+                blockGoalDirection = Coordinate.getDirection(blockGoalCoord, c)
+                if any(map.getMapValueEnum(n) not in occupiedMapValues for n in c.neighbors()
+                    if n != blockGoalCoord and blockGoalDirection != Coordinate.getDirection(c, n)):
+
+                    # On equal distance the first one is kept
+                    distance = Coordinate.distance(agentCurrentCoordinate, c)
+                    if closestDistance is None or distance < closestDistance:
+                        travelIntentionGoal = c
+                        closestDistance = distance
 
         if travelIntentionGoal is not None:
             self.travelIntention = TravelIntention(travelIntentionGoal)
@@ -145,27 +164,38 @@ class ConnectIntention(AgentIntention):
         by rotating and clearing obstacles.
         """
 
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
         faceDirection = Coordinate.getDirection(attachedBlockRelCoord, Coordinate.origo())
-        blockGoalDirection = Coordinate.getDirection(observation.agentCurrentCoordinate, self.blockGoalCoord)
+
+        # Own attached entities must not be cleared
+        attachedCoords = set(agentCurrentCoordinate.getShiftedCoordinate(e.relCoord) for e in observation.agentData.attachedEntities)
+        blockGoalDirection = Coordinate.getDirection(agentCurrentCoordinate, self.blockGoalCoord)
 
         # If double rotation is needed
         if faceDirection.isSameDirection(blockGoalDirection):
             leftDirection, rightDirection = faceDirection.getAdjacentDirections()
-            rotateGoalCoords = [observation.agentCurrentCoordinate.getMovedCoord([leftDirection]),
-                observation.agentCurrentCoordinate.getMovedCoord([rightDirection])]
+            rotateGoalCoords = [agentCurrentCoordinate.getMovedCoord([leftDirection]),
+                agentCurrentCoordinate.getMovedCoord([rightDirection])]
 
             # Need to decide which direction to rotate, try the one which requires to clear action
-            freeCoord = next(filter(lambda c: observation.map.getMapValueEnum(c) in [MapValueEnum.EMPTY, MapValueEnum.DISPENSER], rotateGoalCoords), None)
+            # (the map values are read once for both checks)
+            freeCoord = None
+            blockedCoord = None
+            for c in rotateGoalCoords:
+                mapValue = observation.map.getMapValueEnum(c)
+                if mapValue in rotatableMapValues:
+                    freeCoord = c
+                    break
+
+                if blockedCoord is None and mapValue in clearableMapValues and c not in attachedCoords:
+                    blockedCoord = c
+
             if freeCoord is not None:
-                return RotateAction(attachedBlockRelCoord.getRotateDirection(Coordinate.getDirection(observation.agentCurrentCoordinate, freeCoord).opposite()))
+                return RotateAction.get(attachedBlockRelCoord.getRotateDirection(Coordinate.getDirection(agentCurrentCoordinate, freeCoord).opposite()))
 
-            # If both ways need clearing then chose one which can be cleared
-            blockedCoord = next(filter(lambda c: observation.map.getMapValueEnum(c) in [MapValueEnum.OBSTACLE, MapValueEnum.BLOCK] and \
-                c not in observation.agentData.attachedEntities, rotateGoalCoords), None)
-            
-            # If it is clearable, then clear it
+            # If both ways need clearing then chose one which can be cleared, if it is clearable then clear it
             if blockedCoord is not None:
-                return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, blockedCoord))
+                return ClearAction(Coordinate.getRelativeCoordinate(agentCurrentCoordinate, blockedCoord))
             
             # If an another Agent is blocking, then just skip (TODO: maybe attach if it is enemy Agent?)
             else:
@@ -176,8 +206,8 @@ class ConnectIntention(AgentIntention):
             blockGoalCoordValue = observation.map.getMapValueEnum(self.blockGoalCoord)
             
             # If target Coordinate is occupied then clear it
-            if blockGoalCoordValue in [MapValueEnum.OBSTACLE, MapValueEnum.BLOCK] and self.blockGoalCoord not in observation.agentData.attachedEntities:
-                return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, self.blockGoalCoord))
+            if blockGoalCoordValue in clearableMapValues and self.blockGoalCoord not in attachedCoords:
+                return ClearAction(Coordinate.getRelativeCoordinate(agentCurrentCoordinate, self.blockGoalCoord))
             
             # If an another Agent then skip (TODO: maybe attach if it is enemy Agent?)
             elif blockGoalCoordValue == MapValueEnum.AGENT:
@@ -185,7 +215,7 @@ class ConnectIntention(AgentIntention):
             
             # If free then just rotate
             else:
-                return RotateAction(attachedBlockRelCoord.getRotateDirection(blockGoalDirection.opposite()))
+                return RotateAction.get(attachedBlockRelCoord.getRotateDirection(blockGoalDirection.opposite()))
     
     def handOverAttachedBlock(self, observation: Observation, attachedBlockRelCoord: Coordinate, currentBlockCoord: Coordinate) -> AgentAction:
         """
@@ -198,7 +228,7 @@ class ConnectIntention(AgentIntention):
 
         # Set connected flag if not set
         if not self.connected:
-            self.connected = observation.agentData.lastAction == AgentActionEnum.CONNECT and observation.agentData.lastActionSucceeded
+            self.connected = observation.agentData.lastAction is AgentActionEnum.CONNECT and observation.agentData.lastActionSucceeded
                 
         # If connection is required and not connected then connect the Blocks
         if not self.connected:
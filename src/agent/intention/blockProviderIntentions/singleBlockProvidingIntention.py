@@ -35,7 +35,7 @@ class SingleBlockProvidingIntention(MainAgentIntention):
         self.singleBlockSubmissionIntention = None
         self.adoptRoleIntention = None
         self.detachBlockIntention = None
-        self.skipIntention = SkipIntention(False)
+        self.skipIntention = SkipIntention.get(False)
 
         self.task = task
         self.blockType = task.requirements[0].type
@@ -48,21 +48,22 @@ class SingleBlockProvidingIntention(MainAgentIntention):
         return 5.0
 
     async def planNextAction(self, observation: Observation) -> AgentAction:
-        maxBlockCount = observation.simDataServer.getMaxBlockRegulation()
-
         # If Task has expired or submitted succesfully or goal zone gone
         # or max block count is violated then end the intention and skip
-        if observation.simDataServer.hasTaskExpired(self.task) or \
+        # (the cheapest checks come first). Once finished, the intention keeps
+        # skipping until it is removed, the other checks are not re-evaluated
+        if self.finished or \
             (self.singleBlockSubmissionIntention is not None and self.singleBlockSubmissionIntention.checkFinished(observation)) or \
             self.goalZone not in observation.map.goalZones or \
-            (maxBlockCount is not None and maxBlockCount < len(self.task.requirements)):
+            observation.simDataServer.hasTaskExpired(self.task) or \
+            self.isBlockRegulationViolated(observation):
 
             self.finished = True
             return await self.skipIntention.planNextAction(observation)
 
         # If just initialized and has the wrong Blocks then detach them.
         if self.blockCollectionIntention is None and self.singleBlockSubmissionIntention is None and \
-            any(observation.agentData.attachedEntities) and not self.hasTheBlock(observation):
+            observation.agentData.attachedEntities and not self.hasTheBlock(observation):
 
             return await self.releaseBlocks(observation)
 
@@ -71,11 +72,11 @@ class SingleBlockProvidingIntention(MainAgentIntention):
         roleIndex = 0 if self.singleBlockSubmissionIntention is None or len(agentRoles) == 1 else 1
         
         # If has the wrong role then adopt it
-        if any(agentRoles) and observation.agentMapcRole != agentRoles[roleIndex]:
+        if agentRoles and observation.agentMapcRole != agentRoles[roleIndex]:
             return await self.planRoleAdoptPlan(observation, agentRoles[roleIndex])
 
         # If just initialized and don't have any block, then initialize block collection intention
-        if self.blockCollectionIntention is None and not any(observation.agentData.attachedEntities):
+        if self.blockCollectionIntention is None and not observation.agentData.attachedEntities:
             self.blockCollectionIntention = BlockCollectionIntention(self.blockType,self.intentionDataServer)
 
             if self.singleBlockSubmissionIntention is not None:
@@ -103,6 +104,15 @@ class SingleBlockProvidingIntention(MainAgentIntention):
 
     def checkFinished(self, _: Observation) -> bool:
         return self.finished
+
+    def isBlockRegulationViolated(self, observation: Observation) -> bool:
+        """
+        Returns if the `Task` requires more `Blocks` than
+        the current maximum `Block` regulation allows.
+        """
+
+        maxBlockCount = observation.simDataServer.getMaxBlockRegulation()
+        return maxBlockCount is not None and maxBlockCount < len(self.task.requirements)
     
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
         if self.blockCollectionIntention is not None:
@@ -159,8 +169,8 @@ class SingleBlockProvidingIntention(MainAgentIntention):
         and if it is the only attached entity.
         """
 
-        return len(observation.agentData.attachedEntities) == 1 and \
-            observation.agentData.attachedEntities[0].details == self.blockType
+        attachedEntities = observation.agentData.attachedEntities
+        return len(attachedEntities) == 1 and attachedEntities[0].details == self.blockType
 
     async def releaseBlocks(self, observation : Observation) -> AgentAction:
         """
@@ -5,6 +5,13 @@ from agent.intention import AgentIntention, TravelIntention
 
 from agent.action import AgentAction, SkipAction, SubmitAction, RotateAction, ClearAction, MoveAction
 
+# Map values where the Block can be rotated without clearing
+rotatableMapValues = frozenset((MapValueEnum.EMPTY, MapValueEnum.DISPENSER))
+# Map values which have to be cleared before rotating the Block there
+clearableMapValues = frozenset((MapValueEnum.OBSTACLE, MapValueEnum.BLOCK))
+# Origo for the Direction calculations of relative Coordinates, it is only read
+origoCoordinate = Coordinate.origo()
+
 class SingleBlockSubmissionIntention(AgentIntention):
     """
     Intention for submitting a `Task` which requires
@@ -30,67 +37,54 @@ class SingleBlockSubmissionIntention(AgentIntention):
             not observation.agentData.attachedEntities or \
             self.goalZone not in observation.map.goalZones:
             self.finished = True
-            return SkipAction()
+            return SkipAction.get()
 
         # are we there yet ? if yes, then try to submit
-        if observation.agentCurrentCoordinate in observation.map.goalZones:
-            blockDirection = Coordinate.getDirection(Coordinate.origo(),observation.agentData.attachedEntities[0].relCoord)
-            taskDirection = Coordinate.getDirection(Coordinate.origo(),self.task.requirements[0].coordinate)
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
+        if agentCurrentCoordinate in observation.map.goalZones:
+            blockDirection = Coordinate.getDirection(origoCoordinate,observation.agentData.attachedEntities[0].relCoord)
+            taskDirection = Coordinate.getDirection(origoCoordinate,self.task.requirements[0].coordinate)
 
             # is the block in the right direction ?
             if taskDirection.isSameDirection(blockDirection):
                return SubmitAction(self.task.name)
 
+            # Own attached entities must not be cleared
+            attachedCoords = set(agentCurrentCoordinate.getShiftedCoordinate(e.relCoord) for e in observation.agentData.attachedEntities)
+
+            # where to turn ? the neighbors are looked up once for every case
+            clockDirection, counterClockDirection = blockDirection.getAdjacentDirections()
+            turns = []
+            for direction, rotateDirection in ((clockDirection, RotateDirection.CLOCKWISE), (counterClockDirection, RotateDirection.COUNTERCLOCKWISE)):
+                coord = agentCurrentCoordinate.getMovedCoord([direction])
+                turns.append((direction, rotateDirection, coord, observation.map.getMapValueEnum(coord)))
+
             # opposite direction is the target ?
-            oppositeDirection = blockDirection.opposite()
-            if taskDirection.isSameDirection(oppositeDirection):
-                # where to turn ?
-                clockDirection, counterClockDirection = blockDirection.getAdjacentDirections()
-                clockCoord = observation.agentCurrentCoordinate.getMovedCoord([clockDirection])
-                counterClockCoord = observation.agentCurrentCoordinate.getMovedCoord([counterClockDirection])
-                clockValue = observation.map.getMapValueEnum(clockCoord)
-                counterClockValue = observation.map.getMapValueEnum(counterClockCoord)
+            if taskDirection.isSameDirection(blockDirection.opposite()):
                 # is there free direction ?
-                if clockValue in [MapValueEnum.EMPTY, MapValueEnum.DISPENSER]:
-                    return RotateAction(RotateDirection.CLOCKWISE)
-                if counterClockValue in [MapValueEnum.EMPTY, MapValueEnum.DISPENSER]:
-                    return RotateAction(RotateDirection.COUNTERCLOCKWISE)
+                for _, rotateDirection, _, mapValue in turns:
+                    if mapValue in rotatableMapValues:
+                        return RotateAction.get(rotateDirection)
                 # is there clearable direction ?
-                if clockValue in [MapValueEnum.OBSTACLE,MapValueEnum.BLOCK] and clockCoord not in observation.agentData.attachedEntities:
-                    return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, clockCoord))
-                if counterClockValue in [MapValueEnum.OBSTACLE,MapValueEnum.BLOCK] and counterClockCoord not in observation.agentData.attachedEntities:
-                    return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, counterClockCoord))
+                for _, _, coord, mapValue in turns:
+                    if mapValue in clearableMapValues and coord not in attachedCoords:
+                        return ClearAction(Coordinate.getRelativeCoordinate(agentCurrentCoordinate, coord))
                 # else:
                 #     return self.moveToAnotherGoalPosition(observation)
 
             # adjacent directions may be targets?
-            clockDirection, counterClockDirection = blockDirection.getAdjacentDirections()
-
-            # clock direction is the target ?
-            targetCoord = observation.agentCurrentCoordinate.getMovedCoord([clockDirection])
-            targetMapValue = observation.map.getMapValueEnum(targetCoord)
-            if taskDirection.isSameDirection(clockDirection):
-                if targetMapValue in [MapValueEnum.EMPTY, MapValueEnum.DISPENSER]:
-                    return RotateAction(RotateDirection.CLOCKWISE)
-                if targetMapValue in [MapValueEnum.OBSTACLE,MapValueEnum.BLOCK] and targetCoord not in observation.agentData.attachedEntities:
-                    return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, targetCoord))
-                # else:
-                #     return self.moveToAnotherGoalPosition(observation)
-
-            # counterclock direction is the target ?
-            targetCoord = observation.agentCurrentCoordinate.getMovedCoord([counterClockDirection])
-            targetMapValue = observation.map.getMapValueEnum(targetCoord)
-            if taskDirection.isSameDirection(counterClockDirection):
-                if targetMapValue in [MapValueEnum.EMPTY, MapValueEnum.DISPENSER]:
-                    return RotateAction(RotateDirection.COUNTERCLOCKWISE)
-                if targetMapValue in [MapValueEnum.OBSTACLE,MapValueEnum.BLOCK] and targetCoord not in observation.agentData.attachedEntities:
-                   return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, targetCoord))
-                # else:
-                #     return self.moveToAnotherGoalPosition(observation)
+            for direction, rotateDirection, coord, mapValue in turns:
+                if taskDirection.isSameDirection(direction):
+                    if mapValue in rotatableMapValues:
+                        return RotateAction.get(rotateDirection)
+                    if mapValue in clearableMapValues and coord not in attachedCoords:
+                        return ClearAction(Coordinate.getRelativeCoordinate(agentCurrentCoordinate, coord))
+                    # else:
+                    #     return self.moveToAnotherGoalPosition(observation)
 
         closestGoalZone = observation.map.tryReserveCloserGoalZoneForTask(observation.agentData.id, self.goalZone,
-            observation.agentCurrentCoordinate, [r.coordinate for r in self.task.requirements])
-        if closestGoalZone is not None:
+            agentCurrentCoordinate, [r.coordinate for r in self.task.requirements])
+        if closestGoalZone is not None and closestGoalZone != self.goalZone:
             self.goalZone = closestGoalZone
             self.travelIntention = TravelIntention(self.goalZone)
 
@@ -99,7 +93,7 @@ class SingleBlockSubmissionIntention(AgentIntention):
     def moveToAnotherGoalPosition(self, observation: Observation) -> AgentAction:
         # move in the opposite direction of the task requirement
         # TODO this is not a complete solution, but it may sometimes help
-        return MoveAction([Coordinate.getDirection(observation.agentCurrentCoordinate,observation.agentCurrentCoordinate.getShiftedCoordinate(self.task.requirements[0].coordinate))])
+        return MoveAction.get(Coordinate.getDirection(observation.agentCurrentCoordinate,observation.agentCurrentCoordinate.getShiftedCoordinate(self.task.requirements[0].coordinate)))
 
 
     def checkFinished(self, _: Observation) -> bool:
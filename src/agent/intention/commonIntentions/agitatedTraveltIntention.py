@@ -6,6 +6,9 @@ from agent.intention.commonIntentions.waitIntention import WaitIntention
 
 from agent.action import AgentAction
 
+# Map values where a target Coordinate counts as free (obstacles can be cleared)
+passableMapValues = frozenset((MapValueEnum.EMPTY, MapValueEnum.OBSTACLE, MapValueEnum.UNKNOWN))
+
 class AgitatedTravelIntention(AgentIntention):
     """
     Extended `TravelIntention`, which travels to the given goal `Coordinates`, but
@@ -27,20 +30,24 @@ class AgitatedTravelIntention(AgentIntention):
         # It not initialized or chosen target is occupied or current target is not
         # in the target zones and there is a free target zone
         if self.waitIntention is None or \
-            observation.map.getMapValueEnum(self.waitIntention.travelIntention.coordinate) not in [MapValueEnum.EMPTY, MapValueEnum.OBSTACLE, MapValueEnum.UNKNOWN] or \
+            observation.map.getMapValueEnum(self.waitIntention.travelIntention.coordinate) not in passableMapValues or \
             (self.waitIntention.travelIntention.coordinate not in self.coordinates and \
-                any(observation.map.getMapValueEnum(coord) in [MapValueEnum.EMPTY, MapValueEnum.OBSTACLE, MapValueEnum.UNKNOWN] for coord in self.coordinates)):
+                any(observation.map.getMapValueEnum(coord) in passableMapValues for coord in self.coordinates)):
 
-            # Search for free target Coordinates, which is not reserved for a Task
-            freeGoalCoordinates = list(filter(lambda coord: observation.map.getMapValueEnum(coord)
-                in [MapValueEnum.EMPTY, MapValueEnum.OBSTACLE, MapValueEnum.UNKNOWN] and not observation.map.isCoordinateReservedForTask(coord),
-                self.coordinates))
+            # Search for the closest free target Coordinate, which is not reserved for a Task
+            agentCurrentCoordinate = observation.agentCurrentCoordinate
+            closestFreeGoalCoordinate = None
+            closestDistance = None
+            for coord in self.coordinates:
+                if observation.map.getMapValueEnum(coord) in passableMapValues and not observation.map.isCoordinateReservedForTask(coord):
+                    distance = Coordinate.distance(coord, agentCurrentCoordinate)
+                    if closestDistance is None or distance < closestDistance:
+                        closestFreeGoalCoordinate = coord
+                        closestDistance = distance
 
             # If there is a free target Coordinate then travel to it
-            if any(freeGoalCoordinates):
-                self.waitIntention = WaitIntention(min(freeGoalCoordinates,
-                    key = lambda coord: Coordinate.distance(coord, observation.agentCurrentCoordinate)),
-                    self.allowRotateDuringWait)
+            if closestFreeGoalCoordinate is not None:
+                self.waitIntention = WaitIntention(closestFreeGoalCoordinate, self.allowRotateDuringWait)
             # Else search the closest free Coordinate to the target Coordinates
             else:
                 self.waitIntention = WaitIntention(self.findClosestFreeCoordFromDestinations(observation),
@@ -52,13 +59,13 @@ class AgitatedTravelIntention(AgentIntention):
         return observation.agentCurrentCoordinate in self.coordinates
     
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
-        self.coordinates = set([coord.getShiftedCoordinate(offsetCoordinate) for coord in self.coordinates])
+        self.coordinates = {coord.getShiftedCoordinate(offsetCoordinate) for coord in self.coordinates}
         
         if self.waitIntention is not None:
             self.waitIntention.updateCoordinatesByOffset(offsetCoordinate)
 
     def normalizeCoordinates(self) -> None:
-        self.coordinates = set([coord.copy() for coord in self.coordinates])
+        self.coordinates = {coord.copy() for coord in self.coordinates}
         
         if self.waitIntention is not None:
             self.waitIntention.normalizeCoordinates()
@@ -73,21 +80,29 @@ class AgitatedTravelIntention(AgentIntention):
         """
 
         # Get the closest target Coordinate
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
         nearestGoalCoordinate = min(self.coordinates,
-            key = lambda coord: Coordinate.distance(coord, observation.agentCurrentCoordinate))
+            key = lambda coord: Coordinate.distance(coord, agentCurrentCoordinate))
 
-        # Search the closest Coordinate to the `nearestGoalCoordinate`
+        # Search the closest Coordinate to the `nearestGoalCoordinate`, range by range (each range
+        # contains only its border), the closest free one to the Agent is kept while filtering.
+        # If both map dimensions are known then the ranges wrap around after half of them
+        maxSearchRange = Coordinate.maxWidth // 2 + Coordinate.maxHeight // 2 if Coordinate.dimensionsCalculated else None
         searchRange = 1
-        closestFreeCordinates = list(filter(
-            lambda coord: observation.map.getMapValueEnum(coord) in [MapValueEnum.EMPTY, MapValueEnum.OBSTACLE, MapValueEnum.UNKNOWN]
-                and not observation.map.isCoordinateReservedForTask(coord),
-            nearestGoalCoordinate.getVisionBorderCoordinates(searchRange)))
-                
-        while not any(closestFreeCordinates):
+        closestFreeCoordinate = None
+        while closestFreeCoordinate is None and (maxSearchRange is None or searchRange <= maxSearchRange):
+            closestDistance = None
+            for coord in nearestGoalCoordinate.getVisionBorderCoordinates(searchRange):
+                # Coordinates reserved for a Task are only avoided in the first range
+                if observation.map.getMapValueEnum(coord) in passableMapValues and \
+                    (searchRange > 1 or not observation.map.isCoordinateReservedForTask(coord)):
+
+                    distance = Coordinate.distance(coord, agentCurrentCoordinate)
+                    if closestDistance is None or distance < closestDistance:
+                        closestFreeCoordinate = coord
+                        closestDistance = distance
+
             searchRange += 1
-            closestFreeCordinates = list(filter(
-                lambda coord: observation.map.getMapValueEnum(coord) in [MapValueEnum.EMPTY, MapValueEnum.OBSTACLE, MapValueEnum.UNKNOWN],
-                nearestGoalCoordinate.getVisionBorderCoordinates(searchRange)))
         
-        return min(closestFreeCordinates,
-            key = lambda coord: Coordinate.distance(coord, observation.agentCurrentCoordinate))
+        # If every Coordinate is occupied then just go for the target
+        return closestFreeCoordinate if closestFreeCoordinate is not None else nearestGoalCoordinate
@@ -18,7 +18,7 @@ class AgitatedWaitIntention(AgentIntention):
 
     def __init__(self, coordinates: set[Coordinate], allowRotateDuringWait: bool) -> None:
         self.agitatedTravelIntention = AgitatedTravelIntention(coordinates, allowRotateDuringWait)
-        self.skipIntention = SkipIntention(allowRotateDuringWait)
+        self.skipIntention = SkipIntention.get(allowRotateDuringWait)
     
     async def planNextAction(self, observation : Observation) -> AgentAction:
         # If not reached the given Coordinates then travel to them
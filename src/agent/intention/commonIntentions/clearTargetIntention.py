@@ -7,6 +7,11 @@ from agent.intention.commonIntentions.waitIntention import TravelIntention, Skip
 
 from agent.action import AgentAction, ClearAction
 
+# Map values which make a neighbor unusable for shooting from there
+occupiedMapValues = frozenset((MapValueEnum.AGENT, MapValueEnum.BLOCK))
+# Map values which mean the target is cleared
+clearedMapValues = frozenset((MapValueEnum.EMPTY, MapValueEnum.DISPENSER))
+
 class ClearTargetIntention(AgentIntention):
     """
     Intention to clear the given `Coordinate`: clear `Block`,
@@ -18,12 +23,14 @@ class ClearTargetIntention(AgentIntention):
 
     travelIntention: TravelIntention | None
     targetCoordinate: Coordinate
+    targetNeighbors: list[Coordinate]   # Neighbors of the target, rebuilt only when the target is shifted
 
     def __init__(self, targetCoordinate: Coordinate) -> None:
         self.travelIntention = None
         self.finished = False
-        self.skipIntention = SkipIntention(True)
+        self.skipIntention = SkipIntention.get(True)
         self.targetCoordinate = targetCoordinate
+        self.targetNeighbors = targetCoordinate.neighbors()
     
     async def planNextAction(self, observation: Observation) -> AgentAction:
         # If the given area is unknown then travel there to get information about it
@@ -34,19 +41,20 @@ class ClearTargetIntention(AgentIntention):
             return await self.travelIntention.planNextAction(observation)
         
         # Get free neighbors
-        freeNeighbors = list(filter(lambda c: c == observation.agentCurrentCoordinate or observation.map.getMapValueEnum(c) not in [MapValueEnum.AGENT, MapValueEnum.BLOCK],
-            [n for n in self.targetCoordinate.neighbors()]))
+        agentCurrentCoordinate = observation.agentCurrentCoordinate
+        freeNeighbors = [c for c in self.targetNeighbors
+            if c == agentCurrentCoordinate or observation.map.getMapValueEnum(c) not in occupiedMapValues]
 
         # If there are is no free coordinate then finish,
         # it's not this intention's responsibility to handle this case
-        if not any(freeNeighbors):
+        if not freeNeighbors:
             self.finished = True
             return await self.skipIntention.planNextAction(observation)
 
         # Get the closest free one from where the shot can be made
         closestFreeNeighbor = min(
             freeNeighbors,
-            key = lambda c: Coordinate.distance(observation.agentCurrentCoordinate, c))
+            key = lambda c: Coordinate.distance(agentCurrentCoordinate, c))
         
         if self.travelIntention is None or self.travelIntention.coordinate != closestFreeNeighbor:
             self.travelIntention = TravelIntention(closestFreeNeighbor)
@@ -56,22 +64,24 @@ class ClearTargetIntention(AgentIntention):
             return await self.travelIntention.planNextAction(observation)
         # If the Agent is there then shoot
         else:
-            return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, self.targetCoordinate))
+            return ClearAction(Coordinate.getRelativeCoordinate(agentCurrentCoordinate, self.targetCoordinate))
 
     def checkFinished(self, observation: Observation) -> bool:
-        return self.finished or observation.map.getMapValueEnum(self.targetCoordinate) in [MapValueEnum.EMPTY, MapValueEnum.DISPENSER]
+        return self.finished or observation.map.getMapValueEnum(self.targetCoordinate) in clearedMapValues
     
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
         if self.travelIntention is not None:
             self.travelIntention.updateCoordinatesByOffset(offsetCoordinate)
 
         self.targetCoordinate.updateByOffsetCoordinate(offsetCoordinate)
+        self.targetNeighbors = self.targetCoordinate.neighbors()
     
     def normalizeCoordinates(self) -> None:
         if self.travelIntention is not None:
             self.travelIntention.normalizeCoordinates()
 
         self.targetCoordinate.normalize()
+        self.targetNeighbors = self.targetCoordinate.neighbors()
 
     def explain(self) -> str:
         return "clearing " + str(self.targetCoordinate)
\ No newline at end of file
@@ -23,7 +23,7 @@ class ClearZoneIntention(AgentIntention):
 
     def __init__(self, baseCoordinate: Coordinate) -> None:
         self.clearTargetIntention = None
-        self.skipIntention = SkipIntention(True)
+        self.skipIntention = SkipIntention.get(True)
 
         self.baseCoordinate = baseCoordinate
 
@@ -17,7 +17,7 @@ class DetachBlocksIntention(AgentIntention):
         return DetachAction(Coordinate.getDirection(Coordinate.origo(), adjacentAttachments[0]))
 
     def checkFinished(self, observation: Observation) -> bool:
-        return not any(observation.agentData.attachedEntities)
+        return not observation.agentData.attachedEntities
     
     def updateCoordinatesByOffset(self, _: Coordinate) -> None:
         pass
@@ -32,7 +32,7 @@ class EscapeIntention(MainAgentIntention):
 
     async def planNextAction(self, observation: Observation) -> AgentAction:
         # If there is any attached entity then detach them
-        if any(observation.agentData.attachedEntities):
+        if observation.agentData.attachedEntities:
             if self.detachBlocksIntention is None:
                 self.detachBlocksIntention = DetachBlocksIntention()
             
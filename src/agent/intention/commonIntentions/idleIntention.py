@@ -16,7 +16,7 @@ class IdleIntention(MainAgentIntention):
         return 10.0
 
     async def planNextAction(self, _: Observation) -> AgentAction:
-        return SkipAction()
+        return SkipAction.get()
 
     def checkFinished(self, _: Observation) -> bool:
         return False
@@ -1,4 +1,5 @@
 import random
+import functools
 
 from data.coreData import Coordinate, MapValueEnum
 
@@ -19,6 +20,16 @@ class SkipIntention(AgentIntention):
     def __init__(self, allowRotate: bool) -> None:
         self.allowRotate = allowRotate
 
+    @staticmethod
+    @functools.lru_cache(maxsize = None)
+    def get(allowRotate: bool) -> 'SkipIntention':
+        """
+        Returns the shared `SkipIntention` for the given rotation setting,
+        it has no other state so one instance per setting is enough.
+        """
+
+        return SkipIntention(allowRotate)
+
     async def planNextAction(self, observation: Observation) -> AgentAction:
         # Only rotate if it is allowed, only 1 entity is attached and the
         # entity blocks a dispenser
@@ -37,7 +48,7 @@ class SkipIntention(AgentIntention):
             rotateData = [d[1] for d in [(canRotateToLeftDirection, rightCoordinate), (canRotateToRightDirection, leftCoordinate)] if d[0]]
             # If it can not rotate then just skip
             if not any(rotateData):
-                return SkipAction()
+                return SkipAction.get()
             # Else rotate and clear before, if it is needed
             else:
                 coordinate = random.choice(rotateData)
@@ -45,10 +56,10 @@ class SkipIntention(AgentIntention):
                 if observation.map.getMapValueEnum(coordinate) == MapValueEnum.OBSTACLE:
                     return ClearAction(Coordinate.getRelativeCoordinate(observation.agentCurrentCoordinate, coordinate))
                 else:
-                    return RotateAction(Coordinate.getRotateDirection(observation.agentCurrentCoordinate, Coordinate.getDirection(observation.agentCurrentCoordinate, coordinate)))
+                    return RotateAction.get(Coordinate.getRotateDirection(observation.agentCurrentCoordinate, Coordinate.getDirection(observation.agentCurrentCoordinate, coordinate)))
                 
         else:
-            return SkipAction()
+            return SkipAction.get()
 
     def checkFinished(self, _: Observation) -> bool:
         return False
@@ -21,7 +21,7 @@ class WaitIntention(AgentIntention):
 
     def __init__(self, coordinate: Coordinate, allowRotateDuringWait: bool) -> None:
         self.travelIntention = TravelIntention(coordinate)
-        self.skipIntention = SkipIntention(allowRotateDuringWait)
+        self.skipIntention = SkipIntention.get(allowRotateDuringWait)
     
     async def planNextAction(self, observation : Observation) -> AgentAction:
         # Check if it reached its destination or if it is occupied by an another agent or marker
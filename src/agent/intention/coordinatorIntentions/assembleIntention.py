@@ -27,7 +27,7 @@ class AssembleIntention(AgentIntention):
 
     def __init__(self, blockRelCoord: Coordinate, blockType: str, blockProvidingIntention: BlockProvidingIntention, intentionDataServer: IntentionDataServer) -> None:
         self.blockProvidingIntention = blockProvidingIntention
-        self.skipIntention = SkipIntention(False)
+        self.skipIntention = SkipIntention.get(False)
 
         self.blockRelCoord = blockRelCoord
         self.blockType = blockType
@@ -74,7 +74,7 @@ class AssembleIntention(AgentIntention):
 
         # If the block is adjacent then it just needs to be attached
         if blockCoord in observation.agentCurrentCoordinate.neighbors():
-            return AttachAction(Coordinate.getDirection(observation.agentCurrentCoordinate, blockCoord),
+            return AttachAction.get(Coordinate.getDirection(observation.agentCurrentCoordinate, blockCoord),
                 MapValueEnum.BLOCK,
                 observation.map.getMapValue(blockCoord).details)
         # Else it has to be connected to a specific attached Block
@@ -51,7 +51,7 @@ class CoordinationIntention(MainAgentIntention):
         self.clearZoneIntention = None
         self.currentBlockProvidingIntention = None
         self.detachBlockIntention = None
-        self.skipIntention = SkipIntention(False)
+        self.skipIntention = SkipIntention.get(False)
         self.adoptRoleIntention = None
 
         self.agentId = agentId
@@ -95,7 +95,7 @@ class CoordinationIntention(MainAgentIntention):
         # If there are reserved roles for the Agent and it is not already adopted
         # then adopt it. It is required so the Agent can submit, attach and connect Blocks
         agentRoles = observation.simDataServer.getReservedRolesForAgent(self.agentId)
-        if any(agentRoles) and observation.agentMapcRole != agentRoles[0]:
+        if agentRoles and observation.agentMapcRole != agentRoles[0]:
             return await self.planRoleAdoptPlan(observation, agentRoles[0])
 
         # If a blockprovider is handing over a Block currenctly
@@ -150,8 +150,8 @@ class CoordinationIntention(MainAgentIntention):
             return await self.planClearAction(observation)
 
     def checkFinished(self, observation: Observation) -> bool:        
-        return (observation.agentData.lastAction == AgentActionEnum.SUBMIT and observation.agentData.lastActionSucceeded) or \
-            (self.droppingIntention and self.blockProviderIntentions is None and not any(observation.agentData.attachedEntities))
+        return (observation.agentData.lastAction is AgentActionEnum.SUBMIT and observation.agentData.lastActionSucceeded) or \
+            (self.droppingIntention and self.blockProviderIntentions is None and not observation.agentData.attachedEntities)
 
     def updateCoordinatesByOffset(self, offsetCoordinate: Coordinate) -> None:
         if self.clearZoneIntention is not None:
@@ -328,7 +328,7 @@ class CoordinationIntention(MainAgentIntention):
         finished it.
         """
 
-        if any(observation.agentData.attachedEntities):
+        if observation.agentData.attachedEntities:
             return await self.releaseBlocks(observation)
         else:
             return await self.skipIntention.planNextAction(observation)
@@ -343,7 +343,7 @@ class CoordinationIntention(MainAgentIntention):
 
         # If submit was sent and it failed then it moved,
         # the Agent should notice this earlier, but it's buggy
-        if observation.agentData.lastAction == AgentActionEnum.SUBMIT and \
+        if observation.agentData.lastAction is AgentActionEnum.SUBMIT and \
             (observation.agentData.lastActionResult == "failed" or observation.agentData.lastActionResult == "failed_target"):
             return True
 
@@ -373,7 +373,7 @@ class CoordinationIntention(MainAgentIntention):
         IT RETURNS TRUE IF THERE IS ANY ATTACHED ENTITY, TODO
         """
 
-        return any(observation.agentData.attachedEntities)
+        return len(observation.agentData.attachedEntities) > 0
 
     async def releaseBlocks(self, observation : Observation) -> AgentAction:
         """
@@ -37,7 +37,7 @@ class UpdateMapIntention(MainAgentIntention):
         # If there are reserved roles for the Agent and it is not already adopted
         # then adopt it. It is important because of the Norms
         agentRoles = observation.simDataServer.getReservedRolesForAgent(observation.agentData.id)
-        if any(agentRoles) and observation.agentMapcRole != agentRoles[0]:
+        if agentRoles and observation.agentMapcRole != agentRoles[0]:
             return await self.planRoleAdoptPlan(observation, agentRoles[0])
 
         # If just initialized or reached target or target became occupied then search for a new target
@@ -1,4 +1,4 @@
-from abc import abstractclassmethod
+from abc import abstractmethod
 from agent.intention.agentIntention import AgentIntention
 
 class MainAgentIntention(AgentIntention):
@@ -9,7 +9,7 @@ class MainAgentIntention(AgentIntention):
     Basically the same as `AgentIntention`, but it has a priority.
     """
 
-    @abstractclassmethod
+    @abstractmethod
     def getPriority(self) -> float:
         """
         Returns the priority of `MainAgentIntention`.
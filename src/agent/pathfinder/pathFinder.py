@@ -33,11 +33,6 @@ class PathFinder:
         It searches a path, using the customized A* algorithm, then returns the first step of it.
         """
 
-        agentTravelTime = 1 / pathfinderData.agentSpeed
-        clearCost = pathfinderData.clearConstantCost / (max(pathfinderData.agentEnergy - pathfinderData.clearEnergyCost, 0.1)
-            / pathfinderData.agentMaxEnergy)
-        clearSuccessTime = math.ceil(1 / pathfinderData.clearChance)
-
         agentTravelTime, clearCost, clearSuccessTime = self.calculateTravelConstantCosts(
             pathfinderData.agentSpeed, pathfinderData.clearEnergyCost,
             pathfinderData.agentEnergy, pathfinderData.agentMaxEnergy,
@@ -53,7 +48,7 @@ class PathFinder:
                 pathfinderData.attachedCoordinates, rotateDict)
         # If not found path then just skip, it could raise an Error
         else:
-            return SkipAction()
+            return SkipAction.get()
 
     def findClosestFreeCoordinate(self, pathfinderData: PathFinderData) -> Coordinate:
         """
@@ -181,7 +176,7 @@ class PathFinder:
         
         # If no block is carried then just move
         if len(attachedCoordinates) != 1:
-            return MoveAction(directions)
+            return MoveAction.get(*directions)
 
         attachedCoord = attachedCoordinates[0]
         faceDirection = Coordinate.getDirection(attachedCoord, Coordinate.origo())
@@ -190,9 +185,9 @@ class PathFinder:
         # because the Agent goes straight then just move
         if faceDirection.isSameDirection(directions[0]):
             if (len(directions) == 1 or faceDirection.isSameDirection(directions[1])):
-                return MoveAction(directions)
+                return MoveAction.get(*directions)
             else:
-                return MoveAction([directions[0]])
+                return MoveAction.get(directions[0])
         # If an opposite rotation is needed
         elif faceDirection.isOppositeDirection(directions[0]):
             return self.getActionAtOppositeRotating(map, current, attachedCoord, rotateDict, directions)
@@ -212,9 +207,9 @@ class PathFinder:
         attachedShifted = current.getShiftedCoordinate(attachedCoord).getMovedCoord([directions[0]])
         if map.getMapValueEnum(attachedShifted) in [MapValueEnum.EMPTY, MapValueEnum.UNKNOWN]:
             if len(directions) == 2 and map.getMapValueEnum(attachedShifted.getMovedCoord([directions[1]])) in [MapValueEnum.EMPTY, MapValueEnum.UNKNOWN]:
-                return MoveAction(directions)
+                return MoveAction.get(*directions)
             else:
-                return MoveAction([directions[0]])
+                return MoveAction.get(directions[0])
 
         # If a rotation can not be avoided, then rotate to the given direction
         # and clear before it, if needed
@@ -223,7 +218,7 @@ class PathFinder:
         if map.getMapValueEnum(blockingAdjacentCoord, False) in [MapValueEnum.OBSTACLE, MapValueEnum.BLOCK]:
             return ClearAction(Coordinate.getRelativeCoordinate(current, blockingAdjacentCoord))
         else:
-            return RotateAction(attachedCoord.getRotateDirection(directions[0]))
+            return RotateAction.get(attachedCoord.getRotateDirection(directions[0]))
 
     def getActionAtOppositeRotating(self, map: DynamicMap, current: Coordinate,
         attachedCoord: Coordinate, rotateDict: dict[Coordinate, Direction],
@@ -238,9 +233,9 @@ class PathFinder:
         attachedShifted = current.getShiftedCoordinate(attachedCoord).getMovedCoord([directions[0]])
         if map.getMapValueEnum(attachedShifted) in [MapValueEnum.EMPTY, MapValueEnum.UNKNOWN]:
             if len(directions) == 2 and map.getMapValueEnum(attachedShifted.getMovedCoord([directions[1]])) in [MapValueEnum.EMPTY, MapValueEnum.UNKNOWN]:
-                return MoveAction(directions)
+                return MoveAction.get(*directions)
             else:
-                return MoveAction([directions[0]])
+                return MoveAction.get(directions[0])
 
         # If a rotation can not be avoided, then rotate to the given direction
         # and clear before it, if needed
@@ -250,7 +245,7 @@ class PathFinder:
         if map.getMapValueEnum(blockingAdjacentCoord, False) in [MapValueEnum.OBSTACLE, MapValueEnum.BLOCK]:
             return ClearAction(Coordinate.getRelativeCoordinate(current, blockingAdjacentCoord))
         else:
-            return RotateAction(attachedCoord.getRotateDirection(directionToRotate))
+            return RotateAction.get(attachedCoord.getRotateDirection(directionToRotate))
 
     def getNeighbors(self, map: DynamicMap, startCoordinate: Coordinate, currentCoordinate: Coordinate, vision: int,
         ignoreMarker: bool, attachedCoords: list[Coordinate]) -> list[Tuple[Coordinate, list[Coordinate], dict[Direction, bool]]]:
@@ -131,7 +131,7 @@ class AgentSchedulerServer():
         self.generateOptionsForAgents()
         self.filterOptionsForAgents()
         await self.planNextActionForAgents()
-        self.executeActionForAgents()
+        await self.executeActionForAgents()
         self.checkFinishedCurrentIntentionForAgents()
         
     def generateOptionsForAgents(self) -> None:
@@ -164,27 +164,25 @@ class AgentSchedulerServer():
         coroutines = [agent.planNextAction() for agent in self.getActiveAgents()]
         await asyncio.gather(*coroutines)
     
-    def executeActionForAgents(self) -> None:
+    async def executeActionForAgents(self) -> None:
         """
         Makes the active `Agents` execute their planned `AgentAction`
         and store the retrieved data from the incoming dynamic percept.
         """
 
-        # Send the action
+        # Send the actions concurrently, so the round trips overlap
         activeAgents = self.getActiveAgents()
-        threads = [ThreadWithReturnValue(target = agent.executeAction) for agent in activeAgents]
-        [t.start() for t in threads]
-        results = [t.join() for t in threads]
+        results = await asyncio.gather(*[agent.executeAction() for agent in activeAgents])
 
         # Result process, store the changes
-        for i in range(0, len(activeAgents)):
-            activeAgents[i].processActionResult(results[i])
+        for agent, result in zip(activeAgents, results):
+            agent.processActionResult(result)
         
         # Parse dynamic percept and set observation
-        for i in range(0, len(activeAgents)):
-            activeAgents[i].setDynamicPerceptAfterAction(results[i])
-            self.intentionDataServer.addAgentObservation(activeAgents[i].id, activeAgents[i].observation)
-            self.intentionDataServer.addAgentIntentionRole(activeAgents[i].id, activeAgents[i].intentionHandler.intentionRole)
+        for agent, result in zip(activeAgents, results):
+            agent.setDynamicPerceptAfterAction(result)
+            self.intentionDataServer.addAgentObservation(agent.id, agent.observation)
+            self.intentionDataServer.addAgentIntentionRole(agent.id, agent.intentionHandler.intentionRole)
             
     def checkFinishedCurrentIntentionForAgents(self) -> None:
         """
@@ -8,6 +8,9 @@ from data.server import IntentionDataServer, SimulationDataServer, MapServer
 from agent.intention import CoordinationIntention, BlockProvidingIntention, SingleBlockProvidingIntention, EscapeIntention, ResetIntention
 from agent.agent.agent import Agent
 
+# Intention roles which lead a Task team
+teamLeaderIntentionRoles = frozenset((AgentIntentionRole.COORDINATOR, AgentIntentionRole.SINGLEBLOCKPROVIDER))
+
 class IntentionGenerator():
     """
     Responsible for generating and filtering global options
@@ -292,7 +295,7 @@ class IntentionGenerator():
         for agent in agents:
             if agent.checkFinishedCurrentIntention():
                 if agent.isCurrentIntentionRelatedToTask():
-                    if agent.getIntentionRole() in [AgentIntentionRole.COORDINATOR, AgentIntentionRole.SINGLEBLOCKPROVIDER]:
+                    if agent.getIntentionRole() in teamLeaderIntentionRoles:
                         self.mapServer.getMap(agent.id).freeCoordinatesFromTask(agent.id)
                         del self.taskTeams[agent.id]
 
@@ -332,6 +335,10 @@ class IntentionGenerator():
         
         # If one of them happened, then need to resolve the conflicts (if there is any)
         if mapBoundaryReached or any(offsets):
+            # The maps have been changed, the stored bid results are outdated
+            for agent in agents:
+                agent.clearBidCache()
+
             self.handleReservationConflicts(
                 [map for map in self.mapServer.maps.values() if mapBoundaryReached
                     or any(set(map.agentCoordinates.keys()).intersection(offsets.keys()))],
@@ -385,8 +392,8 @@ class IntentionGenerator():
         """
 
         # Select single block provider Agent
-        soloTaskAgent = min([agent for agent in freeAgents],
-            key = lambda agent: agent.bidSingleBlock(task.requirements[0].type, [r.coordinate for r in task.requirements]))
+        blockRelCoords = [r.coordinate for r in task.requirements]
+        soloTaskAgent = min(freeAgents, key = lambda agent: agent.bidSingleBlock(task.requirements[0].type, blockRelCoords))
 
         freeAgentIds = set([a.id for a in freeAgents])
         singleBlockProviderRoles = self.simDataServer.getSingleBlockProviderRoles(freeAgentIds)
@@ -404,7 +411,7 @@ class IntentionGenerator():
             self.simDataServer.reserveRoleForAgent(soloTaskAgent.id, choice(coordinatorRoles), False)
         
         # Get free goal zone, but there's no need to reserve it at the moment, because it will reserve the goal zone which will be the closest at that time
-        initialGoalZone = map.getClosestFreeGoalZoneForTask(map.getAgentCoordinate(soloTaskAgent.id), [r.coordinate for r in task.requirements])
+        initialGoalZone = map.getClosestFreeGoalZoneForTask(map.getAgentCoordinate(soloTaskAgent.id), blockRelCoords)
 
         # Set intention role and insert intention
         soloTaskAgent.setIntentionRole(AgentIntentionRole.SINGLEBLOCKPROVIDER)
@@ -423,7 +430,8 @@ class IntentionGenerator():
         freeAgentIds = set([a.id for a in freeAgents])
 
         # Select coordinator
-        coordinator = min([agent for agent in freeAgents], key = lambda agent: agent.bidGoalZone([r.coordinate for r in task.requirements]))
+        blockRelCoords = [r.coordinate for r in task.requirements]
+        coordinator = min(freeAgents, key = lambda agent: agent.bidGoalZone(blockRelCoords))
 
         coordinatorRoles = self.simDataServer.getCoordinatorRoles(freeAgentIds)
         self.handleNextRoleReservationForAgent(coordinator.id, coordinatorRoles)
@@ -433,13 +441,13 @@ class IntentionGenerator():
         teamAgentIds.append(coordinator.id)
 
         # Get free goal zone
-        reservedGoalZone = map.getClosestFreeGoalZoneForTask(map.getAgentCoordinate(coordinator.id), [r.coordinate for r in task.requirements])
+        reservedGoalZone = map.getClosestFreeGoalZoneForTask(map.getAgentCoordinate(coordinator.id), blockRelCoords)
 
         blockProviderIdentions = []
 
         # Select block providers for each block
         for i in range(0, len(task.requirements)):
-            blockProvider = min([agent for agent in freeAgents], key = lambda agent: agent.bidDispenser(task.requirements[i].type, reservedGoalZone))
+            blockProvider = min(freeAgents, key = lambda agent: agent.bidDispenser(task.requirements[i].type, reservedGoalZone))
 
             currentBlockProvidingRoles = self.simDataServer.getBlockProviderRoles(freeAgentIds)
             self.handleNextRoleReservationForAgent(blockProvider.id, currentBlockProvidingRoles)
@@ -458,7 +466,7 @@ class IntentionGenerator():
             blockProviderIdentions.append(providingIntention)
         
         # Reserve the goal zone
-        map.reserveCoordinatesForTask(coordinator.id, reservedGoalZone, [r.coordinate for r in task.requirements])
+        map.reserveCoordinatesForTask(coordinator.id, reservedGoalZone, blockRelCoords)
 
         # Set coordinator role and insert intetion
         coordinator.setIntentionRole(AgentIntentionRole.COORDINATOR)
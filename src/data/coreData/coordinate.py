@@ -1,4 +1,7 @@
 import math
+import functools
+
+from typing import Tuple
 
 from data.coreData.enums import Direction, RotateDirection
 
@@ -13,6 +16,7 @@ class Coordinate:
     maxHeight: int | None = None        # Map map height
     dimensionsCalculated: bool = False  # Represesents if both dimensions are calculated
 
+    __slots__ = ("x", "y")
     __match_args__ = ("x", "y")
     def __init__(self, x: float, y: float, normalize: bool = True) -> None:
         if x > 0:
@@ -96,6 +100,19 @@ class Coordinate:
         `distance` param is used for min distance.
         """
 
+        # If the map is wider than the search area, then the distances do not wrap around,
+        # so the precalculated relative offsets can be used
+        if (Coordinate.maxWidth is None or Coordinate.maxWidth > 2 * searchRange) and \
+            (Coordinate.maxHeight is None or Coordinate.maxHeight > 2 * searchRange):
+
+            offsets, selfIndex = Coordinate.getNeighborOffsets(searchRange, distant)
+            neighbors = [Coordinate(self.x + i, self.y + j, normalize) for i, j in offsets]
+
+            if selfIndex is not None and neighbors[selfIndex] == self:
+                del neighbors[selfIndex]
+
+            return neighbors
+
         neighbors = []
         for i in range(self.x - searchRange, self.x + searchRange + 1):
             for j in range(self.y - searchRange, self.y + searchRange + 1):
@@ -109,6 +126,20 @@ class Coordinate:
             
         return neighbors
     
+    @staticmethod
+    @functools.lru_cache(maxsize = 64)
+    def getNeighborOffsets(searchRange: int, distant: int) -> Tuple[Tuple[Tuple[int, int], ...], int | None]:
+        """
+        Returns the relative offsets of the neighbors in the given distance range
+        (in the same order as the `neighbors` method creates them)
+        and the index of the (0, 0) offset if it is included.
+        """
+
+        offsets = tuple((i, j) for i in range(-searchRange, searchRange + 1) for j in range(-searchRange, searchRange + 1)
+            if distant <= abs(i) + abs(j) <= searchRange)
+
+        return (offsets, offsets.index((0, 0)) if (0, 0) in offsets else None)
+
     def getSurroundingNeighbors(self, normalize: bool = True) -> list['Coordinate']:
         """
         Returns the `Coordinate's` neighbors by one Manhattan-distance and the closest
@@ -192,13 +223,14 @@ class Coordinate:
         return Coordinate(self.x, self.y, normalize)
 
     def __eq__(self, other: 'Coordinate') -> bool:
-        return isinstance(other, self.__class__) and self.x == other.x and self.y == other.y
+        return self is other or (isinstance(other, self.__class__) and self.x == other.x and self.y == other.y)
     
     def __neq__(self, other: 'Coordinate') -> bool:
         return not self.__eq__(other)
     
     def __hash__(self) -> int:
-        return hash(tuple(sorted(self.__dict__.items())))
+        # Same value as hashing the sorted instance attributes (x, y)
+        return hash((("x", self.x), ("y", self.y)))
     
     def __str__(self) -> str:
         return "(" + str(self.x) + ", " + str(self.y) + ")"
@@ -265,6 +297,16 @@ class Coordinate:
         Returns the relative `Coordinate` between two absolute ones.
         """
 
+        xDifference, yDifference = Coordinate.getRelativeDifferences(start, end)
+        return Coordinate(xDifference, yDifference, False)
+
+    @staticmethod
+    def getRelativeDifferences(start: 'Coordinate', end: 'Coordinate') -> Tuple[int, int]:
+        """
+        Returns the x and y values of the relative `Coordinate` between
+        two absolute ones, without creating the `Coordinate` itself.
+        """
+
         xDifference = end.x - start.x
         yDifference = end.y - start.y
 
@@ -278,7 +320,7 @@ class Coordinate:
             yRealCoordNeg = yDifference % ((-1) * Coordinate.maxHeight)
             yDifference = yRealCoordPos if abs(yRealCoordPos) < abs(yRealCoordNeg) else yRealCoordNeg
 
-        return Coordinate(xDifference, yDifference, False)
+        return (xDifference, yDifference)
 
     @staticmethod
     def manhattanDistance(start: 'Coordinate', end: 'Coordinate') -> float:
@@ -286,8 +328,8 @@ class Coordinate:
         Returns the Manhatten-distance between two `Coordinates`
         """
 
-        relCoord = Coordinate.getRelativeCoordinate(start, end)
-        return abs(relCoord.x) + abs(relCoord.y)
+        xDifference, yDifference = Coordinate.getRelativeDifferences(start, end)
+        return abs(xDifference) + abs(yDifference)
     
     @staticmethod
     def distance(start: 'Coordinate', end: 'Coordinate') -> float:
@@ -295,8 +337,8 @@ class Coordinate:
         Returns the Euclidean-distance between two `Coordinates`
         """
 
-        relCoord = Coordinate.getRelativeCoordinate(start, end)
-        return math.sqrt(pow(relCoord.x, 2) + pow(relCoord.y, 2))
+        xDifference, yDifference = Coordinate.getRelativeDifferences(start, end)
+        return math.sqrt(xDifference * xDifference + yDifference * yDifference)
     
     @staticmethod
     def getClosestCoordByDistanceByTwoCoordsLine(start: 'Coordinate', end: 'Coordinate', distance: int, multiplier : int = 1) -> 'Coordinate':
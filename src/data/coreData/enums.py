@@ -14,6 +14,9 @@ class MapValueEnum(Enum):
     MARKER = 5
     UNKNOWN = 6
 
+directionStrings = ("n", "e", "s", "w")     # Protocol strings of the Directions, indexed by value
+rotateDirectionStrings = ("cw", "ccw")      # Protocol strings of the RotateDirections, indexed by value
+
 class Direction(Enum):
     """
     Represents the 4 global directions:
@@ -26,15 +29,7 @@ class Direction(Enum):
     WEST = 3
 
     def __str__(self) -> str:
-        match self.value:
-            case 0:
-                return "n"
-            case 1:
-                return "e"
-            case 2:
-                return "s"
-            case 3:
-                return "w"
+        return directionStrings[self.value]
     
     def opposite(self) -> 'Direction':
         """
@@ -81,11 +76,7 @@ class RotateDirection(Enum):
     COUNTERCLOCKWISE = 1
 
     def __str__(self) -> str:
-        match self.value:
-            case 0:
-                return "cw"
-            case 1:
-                return "ccw"
+        return rotateDirectionStrings[self.value]
 
 class AgentActionEnum(Enum):
     """
@@ -1,4 +1,7 @@
-from typing import Any
+import heapq
+import itertools
+
+from typing import Any, Iterator
 
 class PriorityQueueNode:
   """
@@ -11,49 +14,40 @@ class PriorityQueueNode:
 
 class PriorityQueue:
   """
-  Minimum priority queue.
+  Minimum priority queue, stored as a binary heap.
+  Nodes with equal priority are returned in insertion order.
   """
 
   def __init__(self) -> None:
-    self.queue = list()
+    self.queue = list()             # Heap of (priority, insertion order, node) entries
+    self.counter = itertools.count()
     
   def insert(self, node : PriorityQueueNode) -> None:
     """
     Insert node by priority.
     """
 
-    if self.size() == 0:
-      self.queue.append(node)
-    else:
-      for x in range(0, self.size()):
-        if node.priority >= self.queue[x].priority:
-          if x == (self.size() - 1):
-            self.queue.insert(x + 1, node)
-          else:
-            continue
-        else:
-          self.queue.insert(x, node)
-          return
+    heapq.heappush(self.queue, (node.priority, next(self.counter), node))
 
   def pop(self) -> PriorityQueueNode:
     """
     Removes and returns the first value from the queue.
     """
 
-    return self.queue.pop(0)
+    return heapq.heappop(self.queue)[2]
   
   def head(self) -> PriorityQueueNode:
     """
     Returns the first value from the queue.
     """
-    return self.queue[0]
+    return self.queue[0][2]
   
   def contains(self, value: Any) -> bool:
     """
     Returns if value is present in the queue.
     """
 
-    return value in [elem.value for elem in self.queue]
+    return any(elem[2].value == value for elem in self.queue)
 
   def size(self) -> int:
     """
@@ -71,7 +65,15 @@ class PriorityQueue:
   
   def getValues(self) -> list[Any]:
     """
-    Retrieves the values from the queue.
+    Retrieves the values from the queue (not in priority order).
+    """
+
+    return [e[2].value for e in self.queue]
+
+  def __iter__(self) -> Iterator[Any]:
+    """
+    Iterates over the values of the queue (not in priority order)
+    without copying them into a list.
     """
 
-    return [e.value for e in self.queue]
\ No newline at end of file
+    return (e[2].value for e in self.queue)
\ No newline at end of file
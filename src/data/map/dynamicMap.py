@@ -200,9 +200,16 @@ class DynamicMap():
         dispensers = self.dispenserMap.getDispenserCoordsByType(type)
         
         # Dispensers with no marker or agent on it and at least 2 neighbors of it is not occupied by agent, block or marker
-        freeDispensers = list(filter(lambda c: self.getMapValueEnum(c) not in [MapValueEnum.MARKER, MapValueEnum.AGENT] and \
-            (coordinate in c.neighbors() or len([n for n in c.neighbors() if self.getMapValueEnum(n) not in [MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER]]) >= 2),
-            dispensers))
+        freeDispensers = []
+        for dispenser in dispensers:
+            if self.getMapValueEnum(dispenser) in (MapValueEnum.MARKER, MapValueEnum.AGENT):
+                continue
+
+            # The neighbors are calculated only once per dispenser
+            neighbors = dispenser.neighbors()
+            if coordinate in neighbors or \
+                sum(1 for n in neighbors if self.getMapValueEnum(n) not in (MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER)) >= 2:
+                freeDispensers.append(dispenser)
 
         return min(freeDispensers if any(freeDispensers) else dispensers, key = lambda c: Coordinate.distance(c, coordinate)).copy()
 
@@ -502,7 +509,7 @@ class DynamicMap():
         """
 
         roleZones = list(filter(lambda c: c == currentCoordinate or
-            self.getMapValueEnum(c) not in [MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER],
+            self.getMapValueEnum(c) not in (MapValueEnum.AGENT, MapValueEnum.BLOCK, MapValueEnum.MARKER),
             self.roleZones))
         
         if not any(roleZones):
@@ -13,12 +13,19 @@ class MapcRoleServer:
     mapcRoles: list[MapcRole]
     agentRoleReservations: dict[str, list[MapcRole]]
     agentCurrentRoles: dict[str, MapcRole]
+    coordinatorRoles: list[MapcRole]                # Roles capable of coordinating, their actions never change
+    blockProviderRoles: list[MapcRole]              # Roles capable of block providing
+    singleBlockProviderRoles: list[MapcRole]        # Roles capable of single block providing
 
     def __init__(self, mapcRoles: list[MapcRole]) -> None:
         self.mapcRoles = mapcRoles
         self.agentRoleReservations = dict()
         self.agentCurrentRoles = dict()
 
+        self.coordinatorRoles = [r for r in mapcRoles if self.isCoordinatorRole(r)]
+        self.blockProviderRoles = [r for r in mapcRoles if self.isBlockProviderRole(r)]
+        self.singleBlockProviderRoles = [r for r in mapcRoles if self.isSingleBlockProviderRole(r)]
+
     def registerInitialRoleForAgent(self, agentId: str, role: MapcRole) -> None:
         """
         Registers the initial `MapcRole` for the `Agent`. This is not equivivalent to
@@ -87,7 +94,7 @@ class MapcRoleServer:
         """
 
         availableRoleCount = 0
-        for role in [r for r in self.mapcRoles if self.isBlockProviderRole(r)]:
+        for role in self.blockProviderRoles:
             maxRegulation = max(
                 filter(lambda rr: rr.regParam == role.name, roleRegulations),
                 key = lambda rr: rr.regQuantity,
@@ -114,8 +121,8 @@ class MapcRoleServer:
         """
 
         return set(filter(
-            lambda r: self.isCoordinatorRole(r),
-            self.getAllowedRoles(roleRegulations, agentIdIgnoreSet)))
+            lambda r: self.isRoleAllowed(r, roleRegulations, agentIdIgnoreSet),
+            self.coordinatorRoles))
     
     def isCoordinatorRole(self, role: MapcRole) -> bool:
         """
@@ -132,8 +139,8 @@ class MapcRoleServer:
         """
 
         return set(filter(
-            lambda r: self.isBlockProviderRole(r),
-            self.getAllowedRoles(roleRegulations, agentIdIgnoreSet)))
+            lambda r: self.isRoleAllowed(r, roleRegulations, agentIdIgnoreSet),
+            self.blockProviderRoles))
 
     def isBlockProviderRole(self, role: MapcRole) -> bool:
         """
@@ -151,8 +158,8 @@ class MapcRoleServer:
         """
 
         return set(filter(
-            lambda r: self.isSingleBlockProviderRole(r),
-            self.getAllowedRoles(roleRegulations, agentIdIgnoreSet)))
+            lambda r: self.isRoleAllowed(r, roleRegulations, agentIdIgnoreSet),
+            self.singleBlockProviderRoles))
     
     def isSingleBlockProviderRole(self, role: MapcRole) -> bool:
         """
@@ -170,9 +177,17 @@ class MapcRoleServer:
         """
 
         return list(filter(
-            lambda r: all(rr.regParam != r.name or self.getAgentCountForRole(r, agentIdIgnoreSet) < rr.regQuantity for rr in roleRegulations),
+            lambda r: self.isRoleAllowed(r, roleRegulations, agentIdIgnoreSet),
             self.mapcRoles))
 
+    def isRoleAllowed(self, role: MapcRole, roleRegulations: list[NormRegulation], agentIdIgnoreSet: set[str] | None = None) -> bool:
+        """
+        Returns if the given `MapcRole` is allowed for reservations
+        (considering the complied `MapcRole` `NormRegulations`).
+        """
+
+        return all(rr.regParam != role.name or self.getAgentCountForRole(role, agentIdIgnoreSet) < rr.regQuantity for rr in roleRegulations)
+
     def getInterTaskRole(self, roleRegulations: list[NormRegulation]) -> MapcRole | None:
         """
         Returns a `MapcRole` which is either usable for single block providing, block providing or coordinating
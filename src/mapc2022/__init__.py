@@ -17,6 +17,11 @@ import urllib.parse
 from types import TracebackType
 from typing import Any, Dict, List, Union, Generator, Type, Optional, Tuple, TypeVar, Coroutine, Callable
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __version__ = "0.1.0"  # Remember to update setup.py
 
 DirectionLiteral = str
@@ -28,6 +33,20 @@ LOGGER = logging.getLogger(__name__)
 TIMEOUT = None
 
 
+def encode_message(message: Any) -> bytes:
+    """Serializes a message, using orjson if it is available."""
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message).encode("utf-8")
+
+
+def decode_message(message_bytes: Union[bytes, bytearray]) -> Any:
+    """Deserializes a message, using orjson if it is available."""
+    if orjson is not None:
+        return orjson.loads(message_bytes)
+    return json.loads(message_bytes)
+
+
 def unique_id(group: str, uuid: Optional[str] = None) -> int:
     if uuid is None:
         try:
@@ -141,7 +160,7 @@ class AgentProtocol(asyncio.Protocol):
     def send_message(self, message: Any) -> None:
         LOGGER.debug("%s: << %s", self, message)
         assert self.transport is not None, "send_message before connection made"
-        self.transport.write(json.dumps(message).encode("utf-8") + b"\0")
+        self.transport.write(encode_message(message) + b"\0")
 
     def connection_lost(self, exc: Optional[Exception]) -> None:
         LOGGER.info("%s: Connection lost (error: %s)", self, exc)
@@ -157,7 +176,7 @@ class AgentProtocol(asyncio.Protocol):
         self.buffer.extend(data)
         while b"\0" in self.buffer:
             message_bytes, self.buffer = self.buffer.split(b"\0", 1)
-            message = json.loads(message_bytes)
+            message = decode_message(message_bytes)
             LOGGER.debug("%s: >> %s", self, message)
             self.message_received(message)
 
@@ -208,6 +227,21 @@ class AgentProtocol(asyncio.Protocol):
         await self.dynamic
 
     async def send_action(self, tpe: str, params: List[Any]) -> AgentProtocol:
+        result = await self.send_action_result(tpe, params)
+
+        if result != "success":
+            if result is not None:
+                raise AgentActionError(result)
+            else:
+                raise AgentActionError()
+
+        return self
+
+    async def send_action_result(self, tpe: str, params: List[Any]) -> Optional[str]:
+        """
+        Sends an action and returns its result code (None if the server
+        did not report one) instead of raising on failure.
+        """
         async with self.action_lock:
             await self.static
             assert self.state, "state should be set with static"
@@ -237,13 +271,7 @@ class AgentProtocol(asyncio.Protocol):
                 })
                 await asyncio.wait_for(self.action_requested.wait(), TIMEOUT)
 
-            if self.state["percept"].get("lastActionResult") != "success":
-                if "lastActionResult" in self.state["percept"]:
-                    raise AgentActionError(self.state["percept"]["lastActionResult"])
-                else:
-                    raise AgentActionError()
-
-            return self
+            return self.state["percept"].get("lastActionResult")
 
     async def skip(self) -> AgentProtocol:
         return await self.send_action("skip", [])
@@ -538,6 +566,20 @@ class Agent:
             future = asyncio.run_coroutine_threadsafe(_send(), self.protocol.loop)
         return future.result()
 
+    def send_action_nowait(self, tpe: str, params: List[Any]) -> concurrent.futures.Future[Optional[str]]:
+        """
+        Schedules an action on the background event loop without
+        waiting for its result, so actions of multiple agents can be
+        in flight at the same time. The future resolves to the result
+        code of the action, failures are not raised.
+        >>> future = agent.send_action_nowait("move", ["n"])
+        >>> future.result()
+        'success'
+        """
+        with self._not_shut_down():
+            coro = self.protocol.send_action_result(tpe, params)
+            return asyncio.run_coroutine_threadsafe(coro, self.protocol.loop)
+
     def skip(self) -> Agent:
         """
         Skip this turn by doing nothing.